@@ -14,20 +14,143 @@ v0.12
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+import csv
 from dataclasses import dataclass
 from enum import StrEnum
+import functools
+import heapq
+import itertools
+import json
+import threading
+from time import perf_counter
 import warnings
 
 import dearpygui.dearpygui as dpg
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only the batch engine needs it
+    np = None
+
 # -----------------------------------------------------------------------------
 # 				Global Registers
 # -----------------------------------------------------------------------------
 
-animations: list[Animation] = []
-delta_positions = []
-delta_sizes = []
-delta_opacities = []
+# insertion ordered set of all animations, plus indexes by name and by item tag
+animations: dict[Animation, None] = {}
+animations_by_name: dict[str, list[Animation]] = {}
+animations_by_tag: dict[str, list[Animation]] = {}
+
+# animations run() steps through, and a heap of (starttime, order, animation)
+# for the ones that wait for their starttime
+active_animations: dict[Animation, None] = {}
+scheduled_animations: list[tuple[float, int, Animation]] = []
+schedule_order = itertools.count()
+
+# queued animations, see AnimationComposition.QUEUE, each one waits for the animations
+# it was queued behind and starts the frame after the last of them is gone
+waiting_animations: dict[Animation, int] = {}  # queued animation -> animations it still waits for
+queued_behind: dict[Animation, list[Animation]] = {}  # animation -> animations queued behind it
+released_animations: list[Animation] = []  # done waiting, scheduled with the next frame
+
+# accumulated values per item, keyed by the item tag, the batch engine keeps them in its arrays
+delta_positions: dict[str, DeltaEntry] = {}
+delta_sizes: dict[str, DeltaEntry] = {}
+delta_opacities: dict[str, DeltaEntry] = {}
+
+# last values written to dpg per item and animation type, to skip redundant writes,
+# the batch engine keeps them in its arrays as well
+written_values: dict[tuple[str, AnimationType], any] = {}
+skipped_writes = 0  # redundant writes skipped during the last frame
+
+# animation counts, kept up to date on every change instead of scanning the register
+state_counts = {"scheduled": 0, "active": 0, "paused": 0}
+type_counts: dict[AnimationType, int] = {}
+looping_count = 0
+completed_animations = 0  # animations finished during the last frame
+
+# visibility culling, see set_culling(), hidden items keep their latest value until shown again
+culled_types: frozenset[AnimationType] = frozenset()
+visibility_predicate: callable | None = None
+visible_items: dict[str, bool] = {}  # visibility per item, cached for one frame
+culled_values: dict[AnimationType, dict[str, any]] = {"position": {}, "size": {}, "opacity": {}}
+
+# items found deleted while writing, their animations are purged with the next frame
+deleted_items: set[str] = set()
+purged_animations = 0  # animations purged since the start
+frames_since_sweep = 0  # see sweep_deleted_items()
+aborted_callback: callable | None = None  # see set_aborted_callback()
+
+# overlay theme per item, or the rgb of mvText items, resolved once per opacity animation run
+alpha_styles: dict[str, OverlayTheme] = {}
+text_colors: dict[str, list[int]] = {}
+
+# overlay themes bound to faded items, and released ones by the theme they were cloned from
+overlay_themes: dict[str, OverlayTheme] = {}
+theme_pool: dict[int | None, list[OverlayTheme]] = {}
+clones_since_reclaim = 0  # overlays of deleted items are looked for once as many got cloned as are bound
+
+# easing lookup tables, keyed by the ease handles, least recently used first,
+# curves that find the cache full of tables in use are solved by a cached solver instead
+ease_tables: OrderedDict[tuple, list[float]] = OrderedDict()
+ease_table_frames: dict[tuple, int] = {}  # frame each table was last used in
+ease_solvers: OrderedDict[tuple, BezierSolver] = OrderedDict()
+ease_frame = 0  # counts the frames, tables used during the last frame are not evicted
+ease_table_resolution = 1024
+ease_table_maxsize = 64
+ease_epsilon = 1e-7  # tolerance of the bezier solver in x (time)
+
+# frame telemetry, see set_profiling(), one ring buffer row of PROFILE_PHASES
+# per frame in seconds, ease and delta are part of advance
+PROFILE_PHASES = (
+    "frame",
+    "schedule",
+    "advance",
+    "ease",
+    "delta",
+    "set_pos",
+    "set_size",
+    "set_opacity",
+    "callbacks",
+)
+profiling = False
+profile_capacity = 0
+profile_buffer = array("d")
+profile_frames = 0  # frames recorded since profiling was enabled
+profile_laps = [0.0] * len(PROFILE_PHASES)  # phases timed inside the advance step
+profiled_functions: dict[str, callable] = {}  # original functions, while wrapped
+
+# background compute, see set_threaded(), the worker fills the back frame
+# while dpg renders and run() swaps it to the front
+threaded = False
+engine_lock = threading.RLock()  # held while the worker advances the animations
+worker: threading.Thread | None = None
+worker_stop = False
+frame_requested = threading.Event()
+frame_ready = threading.Event()
+frame_pending = False
+frame_target = 0.0  # time the worker advances the animations to
+worker_error: Exception | None = None  # raised by the worker, re-raised by run() on the render thread
+front_frame: FrameBuffer | None = None
+back_frame: FrameBuffer | None = None
+last_run_time: float | None = None
+
+# callback events waiting to be called in order, see set_callback_dispatch()
+callback_queue: deque[tuple] = deque()
+callback_budget: float | None = None  # seconds per frame, None calls all
+callback_pool: ThreadPoolExecutor | None = None
+offloaded_callbacks: set[callable] = set()  # callbacks that may run on the pool
+
+# batch engine, see set_batch_mode()
+batch_mode = False
+batch_state: BatchState | None = None
+batch_stale = True
+batch_pending: list[Animation] = []  # started animations not yet in the arrays
 
 # -----------------------------------------------------------------------------
 # 				Enum for Animation options
@@ -48,670 +171,3803 @@ class AnimationLoopType(StrEnum):
     NO_LOOP = ""
 
 
-# -----------------------------------------------------------------------------
-# 				Animation dataclasses
-# -----------------------------------------------------------------------------
+class AnimationTiming(StrEnum):
+    FRAMES = "frames"  # duration in frames, one step per run()
+    SECONDS = "seconds"  # duration in seconds, progress from dpg.get_total_time()
+
+
+# how a new animation goes along with the animations of its type already on its items
+class AnimationComposition(StrEnum):
+    ADDITIVE = "additive"  # both run, their movements add up
+    REPLACE = "replace"  # the others are removed, the new one starts from its start value
+    QUEUE = "queue"  # the new one starts the frame after the others are gone
+    IGNORE_IF_RUNNING = "ignore_if_running"  # the new one is dropped while another one has started
+
+
+# -----------------------------------------------------------------------------
+# 				Animation dataclasses
+# -----------------------------------------------------------------------------
+
+
+ANIMATION_TYPES = tuple(AnimationType)
+LOOP_TYPES = tuple(AnimationLoopType)
+TIMINGS = tuple(AnimationTiming)
+NO_CALLBACKS = ("", "", "", "")
+
+# store codes compared in the hot loop
+POSITION_CODE = ANIMATION_TYPES.index(AnimationType.POSITION)
+SIZE_CODE = ANIMATION_TYPES.index(AnimationType.SIZE)
+NO_LOOP_CODE = LOOP_TYPES.index(AnimationLoopType.NO_LOOP)
+PING_PONG_CODE = LOOP_TYPES.index(AnimationLoopType.PING_PONG)
+CYCLE_CODE = LOOP_TYPES.index(AnimationLoopType.CYCLE)
+SECONDS_CODE = TIMINGS.index(AnimationTiming.SECONDS)
+
+
+class AnimationStore:
+    """
+    struct-of-arrays storage behind the Animation views, numbers live in typed
+    arrays, eases are interned and callbacks are only stored when set
+    """
+
+    OBJECT_COLUMNS = ("animation_name", "object_name")
+    NUMBER_COLUMNS = {
+        "animation_type": "B",
+        "loop": "B",
+        "timing": "B",
+        "ease": "L",  # index into ease_curves
+        "start_x": "d",
+        "start_y": "d",
+        "distance_x": "d",
+        "distance_y": "d",
+        "duration": "d",
+        "starttime": "d",
+        "frame_counter": "d",
+        "last_ease": "d",
+        "loop_counter": "q",
+        "is_playing": "B",
+        "is_paused": "B",
+        "is_reversed": "B",
+    }
+
+    def __init__(self):
+        for name in self.OBJECT_COLUMNS:
+            setattr(self, name, [])
+
+        for name, typecode in self.NUMBER_COLUMNS.items():
+            setattr(self, name, array(typecode))
+
+        self.ease_curves: list[tuple] = []
+        self.ease_ids: dict[tuple, int] = {}
+        self.callbacks: dict[int, list] = {}  # slot -> callback, data, early callback, data
+        self.tracks: dict[int, KeyframeTrack] = {}  # slot -> keyframes of track animations
+        self.groups: dict[int, AnimationGroup] = {}  # slot -> items of group animations
+        self.blends: dict[int, list] = {}  # slot -> x, y, last value and carried step x, y of the velocity blend, see retarget()
+        self.free_slots: list[int] = []
+
+    def allocate(self):
+        """
+        returns a free slot, growing all columns if needed
+        """
+
+        if self.free_slots:
+            return self.free_slots.pop()
+
+        for name in self.OBJECT_COLUMNS:
+            getattr(self, name).append(None)
+
+        for name in self.NUMBER_COLUMNS:
+            getattr(self, name).append(0)
+
+        return len(self.animation_name) - 1
+
+    def release(self, slot: int):
+        """
+        hands a slot back for reuse
+        """
+
+        for name in self.OBJECT_COLUMNS:
+            getattr(self, name)[slot] = None
+
+        self.callbacks.pop(slot, None)
+        self.tracks.pop(slot, None)
+        self.groups.pop(slot, None)
+        self.blends.pop(slot, None)
+        self.free_slots.append(slot)
+
+    def intern_ease(self, ease):
+        """
+        returns the index of an ease curve, storing each distinct curve once
+        """
+
+        curve = tuple(ease)
+        ease_id = self.ease_ids.get(curve)
+
+        if ease_id is None:
+            ease_id = self.ease_ids[curve] = len(self.ease_curves)
+            self.ease_curves.append(curve)
+
+        return ease_id
+
+    def set_callback(self, slot: int, index: int, value):
+        """
+        sets one of the four callback fields of a slot
+        """
+
+        callbacks = self.callbacks.get(slot)
+
+        if callbacks is None:
+            if not value:
+                return
+            callbacks = self.callbacks[slot] = list(NO_CALLBACKS)
+
+        callbacks[index] = value
+
+
+store = AnimationStore()
+
+
+class StoreColumn:
+    """
+    attribute of the Animation view, backed by one column of the store
+    """
+
+    __slots__ = ("column", "load", "dump")
+
+    def __init__(self, column, load=None, dump=None):
+        self.column = column
+        self.load = load
+        self.dump = dump
+
+    def __get__(self, animation, owner=None):
+        if animation is None:
+            return self
+
+        value = self.column[animation.slot]
+        return value if self.load is None else self.load(value)
+
+    def __set__(self, animation, value):
+        self.column[animation.slot] = value if self.dump is None else self.dump(value)
+
+
+class StoreCallback:
+    """
+    callback attribute of the Animation view, backed by the callback side table
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int):
+        self.index = index
+
+    def __get__(self, animation, owner=None):
+        if animation is None:
+            return self
+
+        return store.callbacks.get(animation.slot, NO_CALLBACKS)[self.index]
+
+    def __set__(self, animation, value):
+        store.set_callback(animation.slot, self.index, value)
+
+
+class Animation:
+    """
+    lightweight view on one slot of the animation store,
+    the slot is released when the view is garbage collected
+    """
+
+    __slots__ = ("slot",)
+
+    animation_name = StoreColumn(store.animation_name)
+    animation_type = StoreColumn(  # either: position size opacity
+        store.animation_type,
+        ANIMATION_TYPES.__getitem__,
+        lambda value: ANIMATION_TYPES.index(AnimationType(value)),
+    )
+    object_name = StoreColumn(store.object_name)
+    duration = StoreColumn(store.duration)
+    starttime = StoreColumn(store.starttime)
+    frame_counter = StoreColumn(store.frame_counter)
+    last_ease = StoreColumn(store.last_ease)
+    loop = StoreColumn(  # either: ping-pong cycle continue
+        store.loop,
+        LOOP_TYPES.__getitem__,
+        lambda value: LOOP_TYPES.index(AnimationLoopType(value)),
+    )
+    timing = StoreColumn(  # either: frames seconds
+        store.timing,
+        TIMINGS.__getitem__,
+        lambda value: TIMINGS.index(AnimationTiming(value)),
+    )
+    loop_counter = StoreColumn(store.loop_counter)
+    callback_function = StoreCallback(0)
+    callback_data = StoreCallback(1)
+    early_callback = StoreCallback(2)
+    early_callback_data = StoreCallback(3)
+    is_playing = StoreColumn(store.is_playing, bool)
+    is_paused = StoreColumn(store.is_paused, bool)
+    is_reversed = StoreColumn(store.is_reversed, bool)
+
+    def __init__(self, **fields):
+        self.slot = store.allocate()
+
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    def __del__(self):
+        if store is not None:  # module globals may be gone at interpreter exit
+            store.release(self.slot)
+
+    def __repr__(self):
+        return (
+            f"Animation(animation_name={self.animation_name!r}, "
+            f"animation_type={self.animation_type!r}, object_name={self.object_name!r})"
+        )
+
+    @property
+    def start_value(self):  # depends on animation type
+        if self.animation_type == AnimationType.OPACITY:
+            return store.start_x[self.slot]
+
+        return [store.start_x[self.slot], store.start_y[self.slot]]
+
+    @start_value.setter
+    def start_value(self, value):
+        try:
+            store.start_x[self.slot], store.start_y[self.slot] = value[0], value[1]
+        except TypeError:
+            store.start_x[self.slot], store.start_y[self.slot] = value, 0
+
+    @property
+    def distance(self):  # depends on animation type
+        if self.animation_type == AnimationType.OPACITY:
+            return store.distance_x[self.slot]
+
+        return [store.distance_x[self.slot], store.distance_y[self.slot]]
+
+    @distance.setter
+    def distance(self, value):
+        try:
+            store.distance_x[self.slot], store.distance_y[self.slot] = value[0], value[1]
+        except TypeError:
+            store.distance_x[self.slot], store.distance_y[self.slot] = value, 0
+
+    @property
+    def ease(self):
+        return list(self.ease_curve)
+
+    @ease.setter
+    def ease(self, value: list[float, float, float, float]):
+        store.ease[self.slot] = store.intern_ease(value)
+
+    @property
+    def ease_curve(self):  # interned tuple of the ease handles
+        return store.ease_curves[store.ease[self.slot]]
+
+    @property
+    def track(self):  # keyframes of a track animation, None for a plain one
+        return store.tracks.get(self.slot)
+
+    @track.setter
+    def track(self, value: KeyframeTrack | None):
+        if value is None:
+            store.tracks.pop(self.slot, None)
+        else:
+            store.tracks[self.slot] = value
+
+    @property
+    def group(self):  # items of a group animation, None for a plain one
+        return store.groups.get(self.slot)
+
+    @group.setter
+    def group(self, value: AnimationGroup | None):
+        if value is None:
+            store.groups.pop(self.slot, None)
+        else:
+            store.groups[self.slot] = value
+
+    @property
+    def item_tags(self):  # all items the animation writes to
+        group = store.groups.get(self.slot)
+        return (self.object_name,) if group is None else group.tags
+
+
+class KeyframeTrack:
+    """
+    sorted (time, value, ease) keys of a track animation, each ease shapes the
+    segment that ends on its key, values are stored relative to the first key
+    """
+
+    __slots__ = (
+        "times",
+        "offsets",
+        "eases",
+        "duration",
+        "start_value",
+        "end_value",
+        "cursor",
+        "last_time",
+        "last_offset",
+    )
+
+    def __init__(self, keys):
+        keys = sorted(keys, key=lambda key: key[0])
+
+        if len(keys) < 2:
+            raise ValueError(f"A keyframe track needs at least 2 keys, got {len(keys)}")
+
+        if keys[0][0] < 0:
+            raise ValueError(f"Keyframe times must not be negative, got {keys[0][0]}")
+
+        self.times = [float(key[0]) for key in keys]
+        self.duration = self.times[-1]
+
+        if self.duration <= 0:
+            raise ValueError(f"The last keyframe must lie after 0, got {self.duration}")
+
+        self.start_value = start_value = keys[0][1]
+        self.end_value = keys[-1][1]
+
+        self.offsets = []
+        for key in keys:
+            try:
+                self.offsets.append((key[1][0] - start_value[0], key[1][1] - start_value[1]))
+            except TypeError:
+                self.offsets.append((key[1] - start_value, 0.0))
+
+        # None is linear
+        self.eases = [tuple(key[2]) if len(key) > 2 and key[2] is not None else None for key in keys]
+        self.cursor = 1  # segment of the last lookup, playback mostly stays in it or moves on by one
+        self.last_time = 0.0  # latest offset, the next step starts from it
+        self.last_offset = self.offsets[0]
+
+    def segment(self, time: float):
+        """
+        returns the index of the key that ends the segment containing time
+        """
+
+        times = self.times
+        cursor = self.cursor
+
+        if not times[cursor - 1] <= time < times[cursor]:
+            if cursor + 1 < len(times) and times[cursor] <= time < times[cursor + 1]:
+                cursor += 1
+            else:
+                cursor = min(max(bisect_right(times, time), 1), len(times) - 1)
+            self.cursor = cursor
+
+        return cursor
+
+    def offset(self, time: float):
+        """
+        returns the value at time relative to the first key
+        """
+
+        if time <= self.times[0]:
+            return self.offsets[0]
+
+        if time >= self.duration:
+            return self.offsets[-1]
+
+        end = self.segment(time)
+        start_time = self.times[end - 1]
+        fraction = (time - start_time) / (self.times[end] - start_time)
+
+        if self.eases[end] is not None:
+            fraction = cached_bezier_transition(fraction, self.eases[end])
+
+        (x0, y0), (x1, y1) = self.offsets[end - 1], self.offsets[end]
+        return x0 + (x1 - x0) * fraction, y0 + (y1 - y0) * fraction
+
+    def step(self, last_progress: float, progress: float):
+        """
+        returns the change of value between two linear progress values
+        """
+
+        last_time = last_progress * self.duration
+        if last_time == self.last_time:
+            x0, y0 = self.last_offset
+        else:
+            x0, y0 = self.offset(last_time)
+
+        self.last_time = progress * self.duration
+        self.last_offset = x1, y1 = self.offset(self.last_time)
+
+        return x1 - x0, y1 - y0
+
+
+class AnimationGroup:
+    """
+    items of a group animation sharing one ease and duration,
+    item i starts stagger * i after the group, values are kept per item
+    """
+
+    __slots__ = ("tags", "start_x", "start_y", "distance_x", "distance_y", "duration", "stagger", "last_eases")
+
+    def __init__(self, tags, start_values, end_values, duration, stagger, opacity: bool = False):
+        self.tags = tuple(tags)
+
+        if not self.tags:
+            raise ValueError("A group animation needs at least one item")
+
+        if duration <= 0:
+            raise ValueError(f"Group duration must be positive, got {duration}")
+
+        if stagger < 0:
+            raise ValueError(f"Group stagger must not be negative, got {stagger}")
+
+        starts = per_item_values(start_values, len(self.tags), opacity)
+        ends = per_item_values(end_values, len(self.tags), opacity)
+
+        self.start_x = array("d", [start[0] for start in starts])
+        self.start_y = array("d", [start[1] for start in starts])
+        self.distance_x = array("d", [end[0] - start[0] for start, end in zip(starts, ends)])
+        self.distance_y = array("d", [end[1] - start[1] for start, end in zip(starts, ends)])
+        self.duration = duration
+        self.stagger = stagger
+        self.last_eases = array("d", bytes(8 * len(self.tags)))
+
+    @property
+    def timeline(self):  # from the first item starting to the last one finishing
+        return self.duration + self.stagger * (len(self.tags) - 1)
+
+    def restart(self, shift: bool = False):
+        """
+        rewinds all items, shift moves their start values on by their distances
+        """
+
+        self.last_eases = array("d", bytes(8 * len(self.tags)))
+
+        if shift:
+            for item in range(len(self.tags)):
+                self.start_x[item] += self.distance_x[item]
+                self.start_y[item] += self.distance_y[item]
+
+
+def per_item_values(values, count: int, opacity: bool = False):
+    """
+    returns one (x, y) pair per item from a shared value or a list of values,
+    opacities get 0 as y
+    """
+
+    if opacity:
+        if isinstance(values, (int, float)):
+            return [(values, 0)] * count
+
+        values = [(value, 0) for value in values]
+
+    else:
+        values = list(values)
+        if values and isinstance(values[0], (int, float)):
+            if len(values) != 2:
+                raise ValueError(f"Expected an (x, y) pair, got {values}")
+            return [(values[0], values[1])] * count
+
+    if len(values) != count:
+        raise ValueError(f"Expected one value per item ({count}), got {len(values)}")
+
+    return [(value[0], value[1]) for value in values]
+
+
+@dataclass(slots=True)
+class DeltaEntry:
+    object_name: str
+    value: any  # [x, y] for position and size, float for opacity
+    state: bool | None  # True running, False finished, None nothing to write
+
+
+@dataclass(slots=True)
+class OverlayTheme:
+    theme: int
+    alpha_style: int
+    base_theme: int | None  # theme the overlay was cloned from
+    opacity: float = 1.0  # last written alpha
+
+
+@dataclass(slots=True)
+class FrameBuffer:
+    positions: list[tuple]
+    sizes: list[tuple]
+    opacities: list[tuple]
+    callbacks: list[tuple]
+    purged: list[str]  # deleted items, their opacity caches are cleared on the render thread
+    completed: int = 0
+
+
+@dataclass(slots=True)
+class BatchState:
+    animations: list[Animation]
+    rows: dict[int, int]  # id(animation) -> row
+    slots: dict[tuple[AnimationType, str], int]  # (animation type, object name) -> slot
+    slot_keys: list[tuple[AnimationType, str]]
+    group_slots: dict[int, any]  # store slot of a group row -> slots of its items
+    item_type: any  # animation type code per slot
+    item_value: any  # accumulated value per slot, two columns, opacity uses the first one
+    item_state: any  # ENTRY_* code per slot, the state of its delta entry
+    item_written: any  # last value written per slot, nan if none
+    eases: dict[int, int]  # store ease id -> row of ease_table
+    ease_table: any  # one sampled table per distinct ease
+    store_slot: any  # slot of the row in the animation store
+    slot_index: any
+    ease_index: any
+    starttime: any
+    duration: any
+    distance: any  # two columns, opacity uses the first one
+    frame_counter: any
+    last_ease: any
+    is_playing: any
+    is_paused: any
+    is_removed: any
+    is_reversed: any
+    is_looping: any
+    is_cycle: any
+    is_timed: any
+    has_early_callback: any
+    is_track: any
+    is_group: any
+    is_blended: any
+
+
+# -----------------------------------------------------------------------------
+# 				Main Functions
+# -----------------------------------------------------------------------------
+
+
+def locked(function):
+    """
+    runs a function of the api only while the background worker is idle
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with engine_lock:
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+@locked
+def add(
+    animation_type: AnimationType,
+    tag: str,
+    start_val,
+    end_val,
+    ease: list[float, float, float, float],
+    duration: int,
+    *,
+    name: str = "",
+    callback="",
+    callback_data="",
+    early_callback="",
+    early_callback_data="",
+    loop=AnimationLoopType.NO_LOOP,
+    timeoffset=0,
+    timing=AnimationTiming.FRAMES,
+    composition=AnimationComposition.ADDITIVE,
+):
+    """
+    adds a new animation to animations register,
+    with timing="seconds" the duration is given in seconds instead of frames,
+    composition decides what happens to animations of the same type already on the item,
+    returns the new animation, None if its composition ignored it
+    """
+
+    now = dpg.get_total_time()
+
+    new_animation = create_animation(
+        now,
+        {},
+        animation_type,
+        tag,
+        start_val,
+        end_val,
+        ease,
+        duration,
+        name=name,
+        callback=callback,
+        callback_data=callback_data,
+        early_callback=early_callback,
+        early_callback_data=early_callback_data,
+        loop=loop,
+        timeoffset=timeoffset,
+        timing=timing,
+    )
+
+    return index_composed(new_animation, composition, now)
+
+
+@locked
+def add_many(specs):
+    """
+    adds many animations at once, specs are the arguments of add() per animation,
+    as dicts or tuples, or one dict of argument columns,
+    returns the new animations in order, None for the ones their composition ignored,
+    they can be passed to play(), pause(), retarget() and remove() instead of a name
+    """
+
+    if isinstance(specs, Mapping):
+        lengths = {len(column) for column in specs.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length, got {sorted(lengths)}")
+
+        specs = [dict(zip(specs, values)) for values in zip(*specs.values())]
+
+    # the clock is read and every item type resolved only once for all animations,
+    # nothing is registered before all specs are valid
+    now = dpg.get_total_time()
+    item_types = {}
+    new_animations = []
+    compositions = []
+
+    for spec in specs:
+        composition = AnimationComposition.ADDITIVE
+
+        if isinstance(spec, Mapping):
+            if "composition" in spec:
+                spec = dict(spec)
+                composition = AnimationComposition(spec.pop("composition"))
+            new_animations.append(create_animation(now, item_types, **spec))
+        else:
+            new_animations.append(create_animation(now, item_types, *spec))
+
+        compositions.append(composition)
+
+    if all(composition == AnimationComposition.ADDITIVE for composition in compositions):
+        index_animations(new_animations, now)
+        return new_animations
+
+    # an animation may compose with the ones added before it in the same call
+    return [
+        index_composed(animation, composition, now)
+        for animation, composition in zip(new_animations, compositions)
+    ]
+
+
+@locked
+def add_track(
+    animation_type: AnimationType,
+    tag: str,
+    keys,
+    *,
+    name: str = "",
+    callback="",
+    callback_data="",
+    early_callback="",
+    early_callback_data="",
+    loop=AnimationLoopType.NO_LOOP,
+    timeoffset=0,
+    timing=AnimationTiming.FRAMES,
+    composition=AnimationComposition.ADDITIVE,
+):
+    """
+    adds a keyframe track, one animation running through (time, value, ease) keys,
+    times count from the start of the track in frames or seconds, the ease of a key
+    shapes the segment that ends on it, None or no ease is linear,
+    returns the new animation, None if its composition ignored it
+    """
+
+    now = dpg.get_total_time()
+    track = KeyframeTrack(keys)
+
+    new_animation = create_animation(
+        now,
+        {},
+        animation_type,
+        tag,
+        track.start_value,
+        track.end_value,
+        [0, 0, 1, 1],
+        track.duration,
+        name=name,
+        callback=callback,
+        callback_data=callback_data,
+        early_callback=early_callback,
+        early_callback_data=early_callback_data,
+        loop=loop,
+        timeoffset=timeoffset,
+        timing=timing,
+    )
+    new_animation.track = track
+
+    return index_composed(new_animation, composition, now)
+
+
+@locked
+def add_group(
+    animation_type: AnimationType,
+    tags: list[str],
+    start_val,
+    end_val,
+    ease: list[float, float, float, float],
+    duration: int,
+    stagger=0,
+    *,
+    name: str = "",
+    callback="",
+    callback_data="",
+    early_callback="",
+    early_callback_data="",
+    loop=AnimationLoopType.NO_LOOP,
+    timeoffset=0,
+    timing=AnimationTiming.FRAMES,
+    composition=AnimationComposition.ADDITIVE,
+):
+    """
+    adds one animation for many items sharing an ease and a duration, item i starts
+    stagger * i later, start_val and end_val are shared or given per item,
+    the callbacks are called once for the whole group with the item tags,
+    composition goes by all items, a replaced group is removed as a whole,
+    returns the new animation, None if its composition ignored it
+    """
+
+    now = dpg.get_total_time()
+    group = AnimationGroup(tags, start_val, end_val, duration, stagger, animation_type == AnimationType.OPACITY)
+
+    if animation_type == AnimationType.SIZE:
+        clamp_group_sizes(group)
+
+    new_animation = Animation(
+        animation_name=name,
+        animation_type=animation_type,
+        object_name=group.tags,
+        start_value=0,
+        distance=0,
+        ease=ease,
+        duration=group.timeline,
+        callback_function=callback,
+        callback_data=callback_data,
+        early_callback=early_callback,
+        early_callback_data=early_callback_data,
+        loop=loop,
+        timing=timing,
+        starttime=(now + timeoffset),
+        is_playing=False,
+        is_paused=False,
+        is_reversed=False,
+        loop_counter=0,
+        last_ease=0,
+        frame_counter=0,
+    )
+    new_animation.group = group
+
+    return index_composed(new_animation, composition, now)
+
+
+def create_animation(
+    now: float,
+    item_types: dict,
+    animation_type: AnimationType,
+    tag: str,
+    start_val,
+    end_val,
+    ease: list[float, float, float, float],
+    duration: int,
+    *,
+    name: str = "",
+    callback="",
+    callback_data="",
+    early_callback="",
+    early_callback_data="",
+    loop=AnimationLoopType.NO_LOOP,
+    timeoffset=0,
+    timing=AnimationTiming.FRAMES,
+) -> Animation:
+    """
+    builds a new animation without registering it,
+    item_types caches the dpg item type per tag
+    """
+
+    if animation_type == AnimationType.SIZE:
+        item_type = item_types.get(tag)
+        if item_type is None:
+            item_type = item_types[tag] = dpg.get_item_type(tag)
+
+        clamp_size_values(item_type, start_val, end_val)
+
+    # rewrite end_val to distance, all calculations are based on distance
+    try:
+        distance = [end_val[0] - start_val[0], end_val[1] - start_val[1]]
+    except Exception:
+        distance = end_val - start_val
+
+    new_animation = Animation(
+        animation_name=name,
+        animation_type=animation_type,
+        object_name=tag,
+        start_value=start_val,
+        distance=distance,
+        ease=ease,
+        duration=duration,
+        callback_function=callback,
+        callback_data=callback_data,
+        early_callback=early_callback,
+        early_callback_data=early_callback_data,
+        loop=loop,
+        timing=timing,
+        starttime=(now + timeoffset),
+        is_playing=False,
+        is_paused=False,
+        is_reversed=False,
+        loop_counter=0,
+        last_ease=0,
+        frame_counter=0,
+    )
+
+    return new_animation
+
+
+def clamp_size_values(item_type: str, start_val, end_val):
+    """
+    fix min-values: smallest size window = 32x32, smallest size item = 1x1
+    """
+
+    if item_type == "mvAppItemType::Window":
+        if min(start_val) < 32:
+            warnings.warn(f"Minimum size for a window is 32 pixels, got {start_val=}")
+
+        if min(end_val) < 32:
+            warnings.warn(f"Minimum size for a window is 32 pixels, got {start_val=}")
+
+        for i in range(2):
+            if start_val[i] < 32:
+                start_val[i] = 32
+
+            elif end_val[i] < 32:
+                end_val[i] = 32
+    else:
+        if min(start_val) < 32:
+            warnings.warn(f"Minimum size for a widget is 1 pixel, got {start_val=}")
+
+        if min(end_val) < 32:
+            warnings.warn(f"Minimum size for a widget is 1 pixel, got {start_val=}")
+
+        for i in range(2):
+            if start_val[i] < 1:
+                start_val[i] = 1
+
+            elif end_val[i] < 1:
+                end_val[i] = 1
+
+
+def clamp_group_sizes(group: AnimationGroup):
+    """
+    applies the min-values of clamp_size_values() to every item of a size group
+    """
+
+    item_types = {}
+    for item, tag in enumerate(group.tags):
+        item_type = item_types.get(tag)
+        if item_type is None:
+            item_type = item_types[tag] = dpg.get_item_type(tag)
+
+        start_val = [group.start_x[item], group.start_y[item]]
+        end_val = [start_val[0] + group.distance_x[item], start_val[1] + group.distance_y[item]]
+        clamp_size_values(item_type, start_val, end_val)
+
+        group.start_x[item], group.start_y[item] = start_val
+        group.distance_x[item] = end_val[0] - start_val[0]
+        group.distance_y[item] = end_val[1] - start_val[1]
+
+
+def run():
+    """
+    Animation data-set layout:
+
+    animation[0] = animation name
+    animation[1] = animation type
+    animation[2] = object name
+    animation[3] = start value
+    animation[4] = distance
+    animation[5] = ease
+    animation[6] = duration
+    animation[7] = starttime
+    animation[8] = frame counter
+    animation[9] = last ease
+    animation[10] = loop
+    animation[11] = loop counter
+    animation[12] = callback function
+    animation[13] = function data
+    animation[14] = early callback
+    animation[15] = early callback data
+    animation[16] = is_playing
+    animation[17] = is_paused
+    animation[18] = is_reversed
+    """
+
+    global skipped_writes
+    global completed_animations
+    global ease_frame
+
+    timer = perf_counter if profiling else float  # float() is 0.0, so disabled laps cost nothing
+    laps = [timer()]
+
+    if threaded or frame_pending:
+        laps.append(timer())  # scheduling runs on the worker
+        frame = swap_frames()
+        laps.append(timer())  # waiting for the worker
+
+        with dpg.mutex():
+            release_purged_items(frame.purged)
+            apply_positions(frame.positions)
+            laps.append(timer())
+            apply_sizes(frame.sizes)
+            laps.append(timer())
+            apply_opacities(frame.opacities)
+            laps.append(timer())
+
+        callbacks = frame.callbacks
+
+    else:
+        skipped_writes = 0
+        completed_animations = 0
+        ease_frame += 1
+        visible_items.clear()
+        callbacks, purged = purge_deleted_items()
+        release_purged_items(purged)
+
+        now = dpg.get_total_time()
+        start_scheduled_animations(now)
+        laps.append(timer())
+
+        if batch_mode:
+            callbacks += advance_batch(now)
+        else:
+            callbacks += advance_animations(now)
+        laps.append(timer())
+
+        set_pos()
+        laps.append(timer())
+        set_size()
+        laps.append(timer())
+        set_opacity()
+        laps.append(timer())
+
+    callback_queue.extend(callbacks)
+    dispatch_callbacks()
+    laps.append(timer())
+
+    if profiling:
+        record_profile(laps)
+
+
+@locked
+def play(animation_name: str | Animation):
+    """
+    resumes the animations of a name, or one animation returned by add_many()
+    """
+
+    now = dpg.get_total_time()
+
+    for animation in select_animations(animation_name):
+        row = batch_state.rows.get(id(animation)) if batch_state is not None else None
+        if row is not None:
+            write_batch_row(batch_state, row)
+
+        # timed animations continue where they were paused
+        if (
+            animation.timing == AnimationTiming.SECONDS
+            and animation.is_paused
+            and animation.is_playing
+        ):
+            if animation.is_reversed:
+                elapsed = animation.duration - animation.frame_counter
+            else:
+                elapsed = animation.frame_counter
+            animation.starttime = now - elapsed
+
+        count_animation(animation, -1)
+        animation.is_paused = False
+        count_animation(animation, 1)
+
+        if row is not None:
+            read_batch_row(batch_state, row)
+
+
+@locked
+def pause(animation_name: str | Animation):
+    """
+    pauses the animations of a name, or one animation returned by add_many()
+    """
+
+    now = dpg.get_total_time()
+
+    for animation in select_animations(animation_name):
+        row = batch_state.rows.get(id(animation)) if batch_state is not None else None
+        if row is not None:
+            write_batch_row(batch_state, row)
+
+        # timed animations keep the progress they made until now
+        if (
+            animation.timing == AnimationTiming.SECONDS
+            and not animation.is_paused
+            and animation.is_playing
+        ):
+            elapsed = max(0, min(now - animation.starttime, animation.duration))
+            if animation.is_reversed:
+                animation.frame_counter = animation.duration - elapsed
+            else:
+                animation.frame_counter = elapsed
+
+        count_animation(animation, -1)
+        animation.is_paused = True
+        count_animation(animation, 1)
+
+        if row is not None:
+            read_batch_row(batch_state, row)
+
+
+@locked
+def retarget(animation_name: str | Animation, end_val, duration=None):
+    """
+    sends running animations to a new end value in place, they start over from their current value
+    with the speed they had, duration defaults to the current one, takes a name or an animation
+    """
+
+    selected = select_animations(animation_name)
+
+    for animation in selected:
+        if animation.group is not None or animation.track is not None:
+            raise ValueError(f"Only plain animations can be retargeted, got {animation_name=}")
+
+    if duration is not None and duration <= 0:
+        raise ValueError(f"Duration must be positive, got {duration=}")
+
+    now = dpg.get_total_time()
+
+    for animation in selected:
+        row = batch_state.rows.get(id(animation)) if batch_state is not None else None
+        if row is not None:
+            write_batch_row(batch_state, row)
+
+        retarget_animation(animation, end_val, duration, now)
+
+        if row is not None:
+            read_batch_row(batch_state, row)
+            retarget_batch_row(batch_state, row)
+
+
+@locked
+def remove(animation_name: str | Animation):
+    """
+    removes the animations of a name, or one animation returned by add_many(), from animations register
+    """
+
+    removed = select_animations(animation_name)[:]
+
+    for animation in removed:
+        drop_animation(animation)
+
+    # drop the accumulated values of items that have no animation of this type left
+    removed_items = {(tag, a.animation_type) for a in removed for tag in a.item_tags}
+    for object_name, animation_type in removed_items:
+        if not is_item_animated(object_name, animation_type):
+            discard_delta_entry(object_name, animation_type)
+
+            if animation_type == AnimationType.OPACITY:
+                alpha_styles.pop(object_name, None)
+                text_colors.pop(object_name, None)
+
+
+# get() keys and how to read them from an animation
+def frame_count(animation: Animation, value: float):
+    """
+    the store keeps counts as floats, frame timed animations report whole frames as int like before
+    """
+
+    if animation.timing == AnimationTiming.FRAMES and value.is_integer():
+        return int(value)
+
+    return value
+
+
+ANIMATION_FIELDS = {
+    "name": lambda animation: animation.animation_name,
+    "type": lambda animation: animation.animation_type,
+    "object": lambda animation: animation.object_name,
+    "startval": lambda animation: animation.start_value,  # Don't touch str, backwards compatibility
+    "endval": lambda animation: end_value(animation),  # Don't touch str, backwards compatibility
+    "ease": lambda animation: animation.ease,
+    "duration": lambda animation: frame_count(animation, animation.duration),
+    "starttime": lambda animation: animation.starttime,
+    "framecounter": lambda animation: frame_count(animation, animation.frame_counter),  # Don't touch str, backwards compatibility
+    "loop": lambda animation: animation.loop,
+    "loopcounter": lambda animation: animation.loop_counter,  # Don't touch str, backwards compatibility
+    "callback": lambda animation: animation.callback_function,
+    "callback_data": lambda animation: animation.callback_data,
+    "early_callback": lambda animation: animation.early_callback,
+    "early_callback_data": lambda animation: animation.early_callback_data,
+    "isplaying": lambda animation: animation.is_playing,  # Don't touch str, backwards compatibility
+    "ispaused": lambda animation: animation.is_paused,  # Don't touch str, backwards compatibility
+}
+
+
+@locked
+def get(*args, name: str | None = None):
+    """
+    return animation data as requested, optionally only for animations with the given name
+    """
+
+    sync_batch()
+
+    if name is None:
+        selected = animations
+    else:
+        selected = animations_by_name.get(name, ())
+
+    getters = [ANIMATION_FIELDS[entry] for entry in args if entry in ANIMATION_FIELDS]
+    return_data = [getter(animation) for animation in selected for getter in getters]
+
+    if not return_data:
+        return False
+
+    return return_data
+
+
+@locked
+def project(names, *fields: str):
+    """
+    returns {animation name: [(field, ...) per animation]} for the given animation names only,
+    fields take the keys of get(), names without animations are left out
+    """
+
+    unknown = [field for field in fields if field not in ANIMATION_FIELDS]
+    if unknown:
+        raise ValueError(f"Invalid animation fields, got {unknown}")
+
+    if isinstance(names, str):
+        names = (names,)
+
+    getters = [ANIMATION_FIELDS[field] for field in fields]
+    projection = {}
+
+    for name in names:
+        selected = animations_by_name.get(name)
+        if selected:
+            if batch_state is not None:  # sync only the selected rows, not the whole batch
+                for animation in selected:
+                    row = batch_state.rows.get(id(animation))
+                    if row is not None:
+                        write_batch_row(batch_state, row)
+
+            projection[name] = [tuple(getter(animation) for getter in getters) for animation in selected]
+
+    return projection
+
+
+@locked
+def get_stats():
+    """
+    returns the animation counts the engine keeps up to date, reading them costs the same for any number of animations
+
+    active: started and not paused
+    scheduled: waiting for their timeoffset
+    paused: paused, started or not
+    looping: animations with a loop
+    completed: animations finished during the last frame
+    purged: animations dropped since the start because their item was deleted
+    queued_callbacks: callbacks carried over to the next frame
+    types: animations per animation type
+    """
+
+    return {
+        "animations": len(animations),
+        "active": state_counts["active"],
+        "scheduled": state_counts["scheduled"],
+        "paused": state_counts["paused"],
+        "looping": looping_count,
+        "completed": front_frame.completed if threaded else completed_animations,
+        "purged": purged_animations,
+        "queued_callbacks": len(callback_queue),
+        "types": {animation_type.value: type_counts.get(animation_type, 0) for animation_type in AnimationType},
+    }
+
+
+@locked
+def get_memory_report():
+    """
+    returns the entry counts of the registers and caches that grow with the animated items,
+    live delta entries belong to animated items, dead ones are written once more and dropped
+    """
+
+    registers = {}
+    for animation_type in AnimationType:
+        tags = [*get_delta_register(animation_type), *batch_item_tags(animation_type)]
+        live = sum(1 for tag in tags if is_item_animated(tag, animation_type))
+        registers[animation_type.value] = {"live": live, "dead": len(tags) - live}
+
+    written = len(written_values) + sum(
+        len(batch_item_tags(animation_type, written=True)) for animation_type in AnimationType
+    )
+
+    return {
+        "delta_registers": registers,
+        "written_values": written,
+        "culled_values": sum(len(values) for values in culled_values.values()),
+        "alpha_styles": len(alpha_styles),
+        "text_colors": len(text_colors),
+        "overlay_themes": len(overlay_themes),
+        "pooled_themes": sum(len(pool) for pool in theme_pool.values()),
+        "ease_tables": len(ease_tables),
+        "ease_solvers": len(ease_solvers),
+        "store_slots": len(store.animation_name),
+        "free_slots": len(store.free_slots),
+        "scheduled_heap": len(scheduled_animations),  # removed animations stay until they are due
+        "waiting_animations": len(waiting_animations),
+        "queued_behind": len(queued_behind),
+        "queued_callbacks": len(callback_queue),
+        "deleted_items": len(deleted_items),  # purged with the next frame
+    }
+
+
+# -----------------------------------------------------------------------------
+# 				Helper Functions
+# -----------------------------------------------------------------------------
+
+
+def end_value(animation: Animation):
+    """
+    returns the value an animation ends on
+    """
+
+    try:
+        return [
+            animation.start_value[0] + animation.distance[0],
+            animation.start_value[1] + animation.distance[1],
+        ]
+    except Exception:
+        return animation.start_value + animation.distance
+
+
+def bezier_transition(search: int, handles: list[float, float, float, float]):
+    """
+    solving y (progress) of bezier curve for given x (time)
+    """
+
+    return BezierSolver(handles, ease_epsilon).evaluate(search)
+
+
+class BezierSolver:
+    """
+    solves one cubic bezier ease curve, the coefficients are computed once,
+    newton steps fall back to bisection where the curve is too flat for them
+    """
+
+    __slots__ = ("handles", "epsilon", "max_newton", "ax", "bx", "cx", "ay", "by", "cy")
+
+    BISECTION_LIMIT = 64  # halvings, more than a double can resolve on [0, 1]
+    MIN_SLOPE = 1e-6
+
+    def __init__(
+        self,
+        handles: list[float, float, float, float],
+        epsilon: float = 1e-7,
+        max_newton: int = 8,
+    ):
+        h1x, h1y, h2x, h2y = handles
+
+        self.handles = tuple(handles)
+        self.epsilon = epsilon
+        self.max_newton = max_newton
+
+        self.cx = 3 * h1x
+        self.bx = 3 * (h2x - h1x) - self.cx
+        self.ax = 1 - self.cx - self.bx
+
+        self.cy = 3 * h1y
+        self.by = 3 * (h2y - h1y) - self.cy
+        self.ay = 1 - self.cy - self.by
+
+    def sample_x(self, t):
+        return ((self.ax * t + self.bx) * t + self.cx) * t
+
+    def sample_y(self, t):
+        return ((self.ay * t + self.by) * t + self.cy) * t
+
+    def slope_x(self, t):
+        return (3 * self.ax * t + 2 * self.bx) * t + self.cx
+
+    def solve(self, search: float):
+        """
+        returns the curve parameter t for x (time) and the iterations it took
+        """
+
+        t = search
+        iterations = 0
+
+        while iterations < self.max_newton:
+            error = self.sample_x(t) - search
+            if abs(error) < self.epsilon:
+                return t, iterations
+
+            slope = self.slope_x(t)
+            if abs(slope) < self.MIN_SLOPE:
+                break
+
+            t -= error / slope
+            iterations += 1
+
+        lower, upper = 0.0, 1.0
+        t = min(max(search, lower), upper)
+
+        for _ in range(self.BISECTION_LIMIT):
+            error = self.sample_x(t) - search
+            if abs(error) < self.epsilon:
+                break
+
+            if error > 0:
+                upper = t
+            else:
+                lower = t
+
+            t = (lower + upper) / 2
+            iterations += 1
+
+        return t, iterations
+
+    def evaluate(self, search: float):
+        """
+        solving y (progress) for given x (time)
+        """
+
+        return self.sample_y(self.solve(search)[0])
+
+    def evaluate_many(self, searches):
+        """
+        solving y (progress) for many x (time) at once, vectorized with numpy,
+        returns an array for an array and a list otherwise
+        """
+
+        if np is None:
+            return [self.evaluate(search) for search in searches]
+
+        x = np.asarray(searches, dtype=np.float64)
+        t = x.copy()
+
+        for _ in range(self.max_newton):
+            slope = self.slope_x(t)
+            flat = np.abs(slope) < self.MIN_SLOPE
+            t = t - np.where(flat, 0.0, (self.sample_x(t) - x) / np.where(flat, 1.0, slope))
+
+        unsolved = ~(np.abs(self.sample_x(t) - x) < self.epsilon)  # catches nan too
+
+        if unsolved.any():
+            search = x[unsolved]
+            lower = np.zeros_like(search)
+            upper = np.ones_like(search)
+
+            for _ in range(self.BISECTION_LIMIT):
+                middle = (lower + upper) / 2
+                above = self.sample_x(middle) > search
+                upper = np.where(above, middle, upper)
+                lower = np.where(above, lower, middle)
+
+            t[unsolved] = (lower + upper) / 2
+
+        y = self.sample_y(t)
+        return y if isinstance(searches, np.ndarray) else y.tolist()
+
+
+@locked
+def set_ease_cache(resolution: int = 1024, maxsize: int = 64, epsilon: float = 1e-7):
+    """
+    configures the easing lookup tables and the tolerance of the bezier solver,
+    drops all cached tables
+    """
+
+    if resolution < 1:
+        raise ValueError(f"Ease table resolution must be at least 1, got {resolution}")
+
+    if maxsize < 1:
+        raise ValueError(f"Ease table maxsize must be at least 1, got {maxsize}")
+
+    if epsilon <= 0:
+        raise ValueError(f"Ease epsilon must be positive, got {epsilon}")
+
+    global ease_table_resolution
+    global ease_table_maxsize
+    global ease_epsilon
+
+    global batch_stale
+
+    ease_table_resolution = resolution
+    ease_table_maxsize = maxsize
+    ease_epsilon = epsilon
+    ease_tables.clear()
+    ease_table_frames.clear()
+    ease_solvers.clear()
+    batch_stale = True
+
+
+def sample_ease_table(handles: list[float, float, float, float]):
+    """
+    returns the progress values of a bezier curve at ease_table_resolution + 1 even steps
+    """
+
+    table = BezierSolver(handles, ease_epsilon).evaluate_many(
+        [i / ease_table_resolution for i in range(ease_table_resolution + 1)]
+    )
+    table[0] = 0.0
+    table[-1] = 1.0
+
+    return table
+
+
+def get_ease_table(handles: list[float, float, float, float]):
+    """
+    returns the sampled progress values of a bezier curve, solving the curve only once per set of handles,
+    None if the cache is full of tables used during the last frame
+    """
+
+    key = tuple(handles)
+    table = ease_tables.get(key)
+
+    if table is not None:
+        ease_tables.move_to_end(key)
+        ease_table_frames[key] = ease_frame
+        return table
+
+    if len(ease_tables) >= ease_table_maxsize:
+        # evicting a table that is still in use would only make it miss again, every frame
+        oldest = next(iter(ease_tables))
+        if ease_table_frames[oldest] >= ease_frame - 1:
+            return None
+
+        del ease_tables[oldest]
+        del ease_table_frames[oldest]
+
+    table = ease_tables[key] = sample_ease_table(handles)
+    ease_table_frames[key] = ease_frame
+    ease_solvers.pop(key, None)
+
+    return table
+
+
+def cached_bezier_transition(search: float, handles: list[float, float, float, float]):
+    """
+    solving y (progress) of bezier curve for given x (time)
+    by linear interpolation in the cached ease table,
+    or with a cached solver while the tables are all in use
+    """
+
+    table = get_ease_table(handles)
+
+    if search <= 0:
+        return 0.0
+
+    if search >= 1:
+        return 1.0
+
+    if table is None:
+        key = tuple(handles)
+        solver = ease_solvers.get(key)
+        if solver is None:
+            solver = ease_solvers[key] = BezierSolver(handles, ease_epsilon)
+            if len(ease_solvers) > ease_table_maxsize:
+                ease_solvers.popitem(last=False)
+
+        return solver.evaluate(search)
+
+    position = search * (len(table) - 1)
+    index = int(position)
+    fraction = position - index
+
+    return table[index] + (table[index + 1] - table[index]) * fraction
+
+
+def index_composed(animation: Animation, composition: AnimationComposition, now: float):
+    """
+    adds an animation to the animations register after applying its composition,
+    returns the animation, None if it was ignored
+    """
+
+    composition = AnimationComposition(composition)
+    blockers = []
+
+    if composition != AnimationComposition.ADDITIVE:
+        conflicts = conflicting_animations(animation)
+
+        if composition == AnimationComposition.IGNORE_IF_RUNNING:
+            if any(conflict in active_animations for conflict in conflicts):
+                return None
+
+        elif composition == AnimationComposition.REPLACE:
+            for conflict in conflicts:
+                drop_animation(conflict)
+
+            # the new animation starts from its own start value, not from what the others left
+            for tag in animation.item_tags:
+                discard_delta_entry(tag, animation.animation_type)
+
+        elif composition == AnimationComposition.QUEUE:
+            blockers = conflicts
+
+    index_animations([animation], now, blockers)
+
+    return animation
+
+
+def conflicting_animations(animation: Animation) -> list[Animation]:
+    """
+    returns the registered animations of the same type on any item of an animation
+    """
+
+    conflicts = {}
+    for tag in animation.item_tags:
+        for other in animations_by_tag.get(tag, ()):
+            if other.animation_type == animation.animation_type:
+                conflicts[other] = None
+
+    return list(conflicts)
+
+
+def index_animations(new_animations: list[Animation], now: float, blockers: list[Animation] = ()):
+    """
+    adds many animations to the animations register and its indexes at once,
+    with blockers the only new animation is queued behind them
+    """
+
+    global looping_count
+
+    animations.update(dict.fromkeys(new_animations))
+
+    scheduled = []
+    queued = 0
+    for animation in new_animations:
+        animations_by_name.setdefault(animation.animation_name, []).append(animation)
+        for tag in animation.item_tags:
+            animations_by_tag.setdefault(tag, []).append(animation)
+
+        animation_type = animation.animation_type
+        type_counts[animation_type] = type_counts.get(animation_type, 0) + 1
+        if animation.loop != AnimationLoopType.NO_LOOP:
+            looping_count += 1
+
+        if blockers:
+            queue_animation(animation, blockers, now)
+            queued += 1
+        elif animation.starttime > now:
+            scheduled.append((animation.starttime, next(schedule_order), animation))
+        else:
+            activate_animation(animation)
+
+    # new animations are never paused, queued ones count as scheduled
+    state_counts["scheduled"] += len(scheduled) + queued
+    state_counts["active"] += len(new_animations) - len(scheduled) - queued
+
+    # one heapify beats many pushes once more entries come in than are waiting
+    if len(scheduled) > len(scheduled_animations):
+        scheduled_animations.extend(scheduled)
+        heapq.heapify(scheduled_animations)
+    else:
+        for entry in scheduled:
+            heapq.heappush(scheduled_animations, entry)
+
+
+def activate_animation(animation: Animation):
+    """
+    hands an animation over to run()
+    """
+
+    active_animations[animation] = None
+
+    if batch_mode:
+        batch_pending.append(animation)
+
+
+def queue_animation(animation: Animation, blockers: list[Animation], now: float):
+    """
+    holds an animation back until all blockers are gone, its timeoffset counts from then
+    """
+
+    waiting_animations[animation] = len(blockers)
+    for blocker in blockers:
+        queued_behind.setdefault(blocker, []).append(animation)
+
+    animation.starttime -= now
+
+
+def release_queued_animations(animation: Animation):
+    """
+    lets the animations queued behind an animation that is gone start once they wait for nothing else
+    """
+
+    waiting_animations.pop(animation, None)
+
+    for queued in queued_behind.pop(animation, ()):
+        if queued in waiting_animations:
+            waiting_animations[queued] -= 1
+            if not waiting_animations[queued]:
+                del waiting_animations[queued]
+                released_animations.append(queued)
+
+
+def start_scheduled_animations(now: float):
+    """
+    activates all scheduled animations whose starttime has come
+    """
+
+    # queued animations done waiting are scheduled from now on
+    for animation in released_animations:
+        if animation in animations:
+            animation.starttime += now
+            heapq.heappush(scheduled_animations, (animation.starttime, next(schedule_order), animation))
+    released_animations.clear()
+
+    while scheduled_animations and scheduled_animations[0][0] <= now:
+        animation = heapq.heappop(scheduled_animations)[2]
+
+        # removed animations stay in the heap until they are due
+        if animation in animations:
+            count_animation(animation, -1)
+            activate_animation(animation)
+            count_animation(animation, 1)
+
+
+def count_animation(animation: Animation, count: int):
+    """
+    adds count to the state the animation is counted in,
+    -1 before the state of a registered animation changes and 1 after it
+    """
+
+    if animation.is_paused:
+        state_counts["paused"] += count
+    elif animation in active_animations:
+        state_counts["active"] += count
+    else:
+        state_counts["scheduled"] += count
+
+
+def unindex_animation(animation: Animation):
+    """
+    removes an animation from the animations register and its indexes
+    """
+
+    global looping_count
+
+    if animation not in animations:
+        return
+
+    count_animation(animation, -1)
+    type_counts[animation.animation_type] -= 1
+    if animation.loop != AnimationLoopType.NO_LOOP:
+        looping_count -= 1
+
+    del animations[animation]
+    active_animations.pop(animation, None)
+
+    for index, key in [(animations_by_name, animation.animation_name)] + [
+        (animations_by_tag, tag) for tag in animation.item_tags
+    ]:
+        entries = index[key]
+        entries.remove(animation)
+        if not entries:
+            del index[key]
+
+    # items no animation of this type refers to anymore leave the delta register
+    for tag in animation.item_tags:
+        if not is_item_animated(tag, animation.animation_type):
+            release_delta_entry(tag, animation.animation_type)
+
+    if queued_behind:
+        release_queued_animations(animation)
+
+
+def select_animations(animation_name: str | Animation) -> list[Animation]:
+    """
+    returns the registered animations of a name, or the animation itself if it is still registered,
+    animations returned by add_many() are handles for the control functions, setting their fields
+    directly bypasses the engine counts and the batch rows
+    """
+
+    if isinstance(animation_name, Animation):
+        return [animation_name] if animation_name in animations else []
+
+    return animations_by_name.get(animation_name, [])
+
+
+def drop_animation(animation: Animation):
+    """
+    unregisters an animation before it finished, its batch row goes with the next frame
+    """
+
+    unindex_animation(animation)
+
+    if batch_state is not None and id(animation) in batch_state.rows:
+        batch_state.is_removed[batch_state.rows[id(animation)]] = True
+
+
+def is_item_animated(tag, animation_type: AnimationType) -> bool:
+    """
+    checks if any registered animation of the type targets the item
+    """
+
+    for animation in animations_by_tag.get(tag, ()):
+        if animation.animation_type == animation_type:
+            return True
+
+    return False
+
+
+def release_delta_entry(tag, animation_type: AnimationType):
+    """
+    drops the delta entry of an item, an entry with a pending write is written one last time first
+    """
+
+    slot = batch_item_slot(tag, animation_type)
+    if slot is not None:
+        if batch_state.item_state[slot] == ENTRY_IDLE:
+            batch_state.item_state[slot] = NO_ENTRY
+            batch_state.item_written[slot] = np.nan
+        elif batch_state.item_state[slot] == ENTRY_RUNNING:
+            batch_state.item_state[slot] = ENTRY_FINISHED
+        return
+
+    register = get_delta_register(animation_type)
+    entry = register.get(tag)
+
+    if entry is None:
+        return
+
+    if entry.state is None:
+        del register[tag]
+        written_values.pop((tag, animation_type), None)
+    else:
+        entry.state = False
+
+
+def discard_delta_entry(tag, animation_type: AnimationType):
+    """
+    drops the delta entry and the last written value of an item
+    """
+
+    get_delta_register(animation_type).pop(tag, None)
+    written_values.pop((tag, animation_type), None)
+
+    slot = batch_item_slot(tag, animation_type)
+    if slot is not None:
+        batch_state.item_state[slot] = NO_ENTRY
+        batch_state.item_written[slot] = np.nan
+
+
+def get_delta_entry(tag, animation_type: AnimationType) -> DeltaEntry | None:
+    """
+    returns the delta entry of an item, a copy if the batch arrays hold the item
+    """
+
+    slot = batch_item_slot(tag, animation_type)
+    if slot is None:
+        return get_delta_register(animation_type).get(tag)
+
+    item_state = batch_state.item_state[slot]
+    if item_state == NO_ENTRY:
+        return None
+
+    value = batch_state.item_value[slot].tolist()
+    return DeltaEntry(tag, value[0] if animation_type == AnimationType.OPACITY else value, DELTA_STATES[item_state])
+
+
+def advance_animations(now: float):
+    """
+    advances all active animations by one frame and collects their deltas,
+    returns the (callback, object, data) events of this frame in order
+    """
+
+    global completed_animations
+
+    callbacks = []
+
+    # the hot loop reads the store columns directly instead of going through the views
+    animation_types = store.animation_type
+    timings = store.timing
+    loops = store.loop
+    eases = store.ease
+    durations = store.duration
+    starttimes = store.starttime
+    frame_counters = store.frame_counter
+    last_eases = store.last_ease
+    is_playing = store.is_playing
+    is_paused = store.is_paused
+    is_reversed = store.is_reversed
+    distances_x = store.distance_x
+    distances_y = store.distance_y
+    ease_curves = store.ease_curves
+    tracks = store.tracks
+    groups = store.groups
+    blends = store.blends
+
+    for animation in list(active_animations):
+        slot = animation.slot
+        if not is_paused[slot]:
+            timed = timings[slot] == SECONDS_CODE
+            duration = durations[slot]
+
+            if timed:
+                # the clock may stay on 0 for a frame, so timed animations start on is_playing
+                starting = not is_playing[slot]
+            else:
+                starting = frame_counters[slot] == 0
+
+            if starting and animation.early_callback:
+                callbacks.append(
+                    (animation.early_callback, animation.object_name, animation.early_callback_data)
+                )
+
+            is_playing[slot] = True
+            restarting = False
+
+            if timed:
+                elapsed = min(now - starttimes[slot], duration)
+                if is_reversed[slot]:
+                    frame_counters[slot] = duration - elapsed
+                else:
+                    frame_counters[slot] = elapsed
+
+            group = groups.get(slot)
+            if group is not None:
+                # groups keep their linear progress as ease, each item eases on its own phase
+                ease = min(max(frame_counters[slot] / duration, 0.0), 1.0)
+                add_group_deltas(animation, group, frame_counters[slot])
+
+            else:
+                track = tracks.get(slot)
+                if track is None:
+                    ease = cached_bezier_transition(frame_counters[slot] / duration, ease_curves[eases[slot]])
+                    x_step = distances_x[slot] * (ease - last_eases[slot])
+                    y_step = distances_y[slot] * (ease - last_eases[slot])
+
+                    # retargeted animations carry their old speed in
+                    if blends and slot in blends:
+                        blend_x, blend_y = blend_step(blends[slot], frame_counters[slot] / duration, ease)
+                        x_step += blend_x
+                        y_step += blend_y
+                else:
+                    # keyframe tracks keep their linear progress as ease, the keys ease themselves
+                    ease = min(max(frame_counters[slot] / duration, 0.0), 1.0)
+                    x_step, y_step = track.step(last_eases[slot], ease)
+
+                animation_type = animation_types[slot]
+                if animation_type == POSITION_CODE:
+                    add_delta_positions(animation, x_step, y_step)
+
+                elif animation_type == SIZE_CODE:
+                    add_delta_sizes(animation, x_step, y_step)
+
+                else:
+                    add_delta_opacities(animation, x_step)
+
+            last_eases[slot] = ease
+            frame_counter = frame_counters[slot]
+
+            if frame_counter < duration or is_reversed[slot]:
+                if timed:
+                    # progress comes from the clock, only a finished way back is handled here
+                    if is_reversed[slot] and frame_counter == 0:
+                        is_reversed[slot] = False
+                        starttimes[slot] += duration
+                        restarting = True
+
+                elif not is_reversed[slot]:
+                    frame_counters[slot] += 1
+                else:
+                    if frame_counter == 0:
+                        is_reversed[slot] = False
+                        frame_counters[slot] = 1
+                    else:
+                        frame_counters[slot] -= 1
+
+            elif frame_counter == duration:
+                if loops[slot] != NO_LOOP_CODE:
+                    set_loop(animation)
+                    restarting = loops[slot] != PING_PONG_CODE
+                else:
+                    unindex_animation(animation)
+                    completed_animations += 1
+
+                if animation.callback_function:
+                    callbacks.append(
+                        (animation.callback_function, animation.object_name, animation.callback_data)
+                    )
+
+            else:
+                unindex_animation(animation)
+                completed_animations += 1
+
+            # the next iteration of a timed animation already started on the clock
+            if restarting and timed and animation.early_callback:
+                callbacks.append(
+                    (animation.early_callback, animation.object_name, animation.early_callback_data)
+                )
+
+    return callbacks
+
+
+def set_loop(animation: Animation):
+    """
+    prepare animation for next loop iteration
+    """
+
+    if animation.loop == AnimationLoopType.PING_PONG:
+        animation.is_reversed = True
+        if animation.timing == AnimationTiming.FRAMES:
+            animation.frame_counter -= 1
+        animation.last_ease = 1
+
+    elif animation.loop == AnimationLoopType.CYCLE:
+        animation.frame_counter = 0
+        animation.last_ease = 0
+
+    elif animation.loop == AnimationLoopType.CONTINUE:
+        try:
+            animation.start_value = [
+                animation.start_value[0] + animation.distance[0],
+                animation.start_value[1] + animation.distance[1],
+            ]
+        except Exception:
+            animation.start_value += animation.distance
+        animation.frame_counter = 0
+        animation.last_ease = 0
+    
+    elif animation.loop == AnimationLoopType.NO_LOOP:
+        pass
+    
+    else:
+        raise ValueError(f"Invalid animation loop type, got {animation.loop}")
+
+    # the velocity blend is back on 0 at the end, the next iteration runs without it
+    store.blends.pop(animation.slot, None)
+
+    group = animation.group
+    if group is not None and animation.loop != AnimationLoopType.PING_PONG:
+        group.restart(shift=animation.loop == AnimationLoopType.CONTINUE)
+
+    # the next iteration starts where this one should have ended, skipping late frames
+    if animation.timing == AnimationTiming.SECONDS:
+        animation.starttime += animation.duration
+
+    animation.loop_counter += 1
+    return animation
+
+
+def retarget_animation(animation: Animation, end_val, duration, now: float):
+    """
+    restarts an animation from its current value towards end_val, a velocity blend keeps its speed
+    """
+
+    slot = animation.slot
+    old_duration = store.duration[slot]
+    new_duration = duration if duration is not None else old_duration
+
+    try:
+        end_x, end_y = end_val[0], end_val[1]
+    except TypeError:
+        end_x, end_y = end_val, 0
+
+    # an animation that has not moved yet only gets the new end
+    if not store.is_playing[slot]:
+        store.duration[slot] = new_duration
+        store.distance_x[slot] = end_x - store.start_x[slot]
+        store.distance_y[slot] = end_y - store.start_y[slot]
+        return
+
+    # one step is one frame, or the last frame time for timed animations
+    timed = animation.timing == AnimationTiming.SECONDS
+    step_time = dpg.get_delta_time() if timed else 1
+
+    current_x, current_y = current_offset(animation)
+    step_x, step_y = last_step(animation, step_time / old_duration)
+    current_x += store.start_x[slot]
+    current_y += store.start_y[slot]
+
+    distance_x = end_x - current_x
+    distance_y = end_y - current_y
+
+    # the blend adds a share of the last step to the first step of the new way, retargets on every
+    # frame then pull by the first ease and carry that share on, which is critically damped for
+    # carry = (1 - sqrt(first ease))², so they settle on a fixed end without overshooting
+    first_progress = step_time / new_duration
+    store.blends.pop(slot, None)
+
+    if 0 < first_progress < 1:
+        first_ease = cached_bezier_transition(first_progress, animation.ease_curve)
+        carry = (1 - min(max(first_ease, 0.0), 1.0) ** 0.5) ** 2
+
+        # the linear part bounds the blend of eases that start flat or backwards
+        first_blend = max(blend_curve(first_progress, first_ease), blend_curve(first_progress, 0.0))
+        store.blends[slot] = [carry * step_x / first_blend, carry * step_y / first_blend, 0.0, step_x, step_y]
+
+    store.start_x[slot], store.start_y[slot] = current_x, current_y
+    store.distance_x[slot], store.distance_y[slot] = distance_x, distance_y
+    store.duration[slot] = new_duration
+    store.last_ease[slot] = 0
+
+    # the new way starts where the last step left off, its first step moves on from there
+    if not timed:
+        store.frame_counter[slot] = 1
+    elif store.is_paused[slot]:
+        store.frame_counter[slot] = 0
+        store.starttime[slot] = now
+    else:
+        elapsed = store.frame_counter[slot]
+        if store.is_reversed[slot]:
+            elapsed = old_duration - elapsed
+        store.frame_counter[slot] = 0
+        store.starttime[slot] += elapsed
+
+    store.is_reversed[slot] = False
+
+
+def current_offset(animation: Animation):
+    """
+    returns the value an animation added to its start value so far
+    """
+
+    slot = animation.slot
+    last_ease = store.last_ease[slot]
+    offset_x = store.distance_x[slot] * last_ease
+    offset_y = store.distance_y[slot] * last_ease
+
+    blend = store.blends.get(slot)
+    if blend is not None:
+        offset_x += blend[0] * blend[2]
+        offset_y += blend[1] * blend[2]
+
+    return offset_x, offset_y
+
+
+def last_step(animation: Animation, progress_step: float):
+    """
+    returns the change of value the last step of an animation made,
+    progress_step is the progress one step makes
+    """
+
+    slot = animation.slot
+    if store.is_paused[slot]:
+        return 0.0, 0.0
+
+    # retargeted again before its first step, the animation still carries the step it was given
+    blend = store.blends.get(slot)
+    if blend is not None and blend[2] == 0:
+        return blend[3], blend[4]
+
+    if store.is_reversed[slot]:
+        progress_step = -progress_step
+
+    # frame animations already counted their next frame
+    progress = store.frame_counter[slot] / store.duration[slot]
+    if animation.timing == AnimationTiming.FRAMES:
+        progress -= progress_step
+    progress = min(max(progress - progress_step, 0.0), 1.0)
+
+    ease = cached_bezier_transition(progress, animation.ease_curve)
+    step_x = store.distance_x[slot] * (store.last_ease[slot] - ease)
+    step_y = store.distance_y[slot] * (store.last_ease[slot] - ease)
+
+    if blend is not None:
+        blend_value = blend_curve(progress, ease)
+        step_x += blend[0] * (blend[2] - blend_value)
+        step_y += blend[1] * (blend[2] - blend_value)
+
+    return step_x, step_y
+
+
+def blend_curve(progress: float, ease: float) -> float:
+    """
+    shape of the velocity blend, 0 at both ends, rising with the ease so front loaded eases
+    do not run off, the linear part keeps a start slope for eases that start flat
+    """
+
+    return (progress + ease) / 2 * (1 - progress)
+
+
+def blend_step(blend: list[float], progress: float, ease: float):
+    """
+    returns the change of the velocity blend of a retargeted animation up to progress
+    """
+
+    value = blend_curve(min(max(progress, 0.0), 1.0), ease)
+    step = value - blend[2]
+    blend[2] = value
+
+    return blend[0] * step, blend[1] * step
+
+
+def add_delta_positions(animation: Animation, x_step: float, y_step: float):
+    """
+    collects delta movements of all position animations for a certain item
+    """
+
+    slot = animation.slot
+    object_name = store.object_name[slot]
+    entry = delta_positions.get(object_name)
+
+    if entry is None:
+        delta_positions[object_name] = DeltaEntry(
+            object_name,
+            [store.start_x[slot] + x_step, store.start_y[slot] + y_step],
+            True,
+        )
+        return
+
+    entry.value[0] += x_step
+    entry.value[1] += y_step
+
+    update_delta_state(entry, slot)
+
+
+def add_delta_sizes(animation: Animation, x_step: float, y_step: float):
+    """
+    collects delta movements of all size animations for a certain item
+    """
+
+    slot = animation.slot
+    object_name = store.object_name[slot]
+    entry = delta_sizes.get(object_name)
+
+    if entry is None:
+        delta_sizes[object_name] = DeltaEntry(
+            object_name,
+            [store.start_x[slot] + x_step, store.start_y[slot] + y_step],
+            True,
+        )
+        return
+
+    entry.value[0] += x_step
+    entry.value[1] += y_step
+
+    update_delta_state(entry, slot)
+
+
+def add_delta_opacities(animation: Animation, o_step: float):
+    """
+    collects delta movements of all opacity animations for a certain item
+    """
+
+    slot = animation.slot
+    object_name = store.object_name[slot]
+    entry = delta_opacities.get(object_name)
+
+    if entry is None:
+        delta_opacities[object_name] = DeltaEntry(object_name, store.start_x[slot] + o_step, True)
+        return
+
+    entry.value += o_step
+
+    update_delta_state(entry, slot)
+
+
+def add_group_deltas(animation: Animation, group: AnimationGroup, frame_counter: float):
+    """
+    collects delta movements of all items of a group animation,
+    the ease is solved once per distinct item phase
+    """
+
+    slot = animation.slot
+    register = get_delta_register(animation.animation_type)
+    opacity = animation.animation_type == AnimationType.OPACITY
+    curve = animation.ease_curve
+    phases = {}
+
+    for item, tag in enumerate(group.tags):
+        progress = min(max((frame_counter - item * group.stagger) / group.duration, 0.0), 1.0)
+        ease = phases.get(progress)
+        if ease is None:
+            ease = phases[progress] = cached_bezier_transition(progress, curve)
+
+        step = ease - group.last_eases[item]
+        group.last_eases[item] = ease
+        x_step = group.distance_x[item] * step
+        y_step = group.distance_y[item] * step
+
+        entry = register.get(tag)
+
+        if entry is None:
+            if opacity:
+                value = group.start_x[item] + x_step
+            else:
+                value = [group.start_x[item] + x_step, group.start_y[item] + y_step]
+
+            register[tag] = DeltaEntry(tag, value, True)
+            continue
+
+        if opacity:
+            entry.value += x_step
+        else:
+            entry.value[0] += x_step
+            entry.value[1] += y_step
+
+        update_delta_state(entry, slot)
+
+
+def get_delta_register(animation_type: AnimationType):
+    """
+    returns the delta register of an animation type
+    """
+
+    if animation_type == AnimationType.POSITION:
+        return delta_positions
+
+    elif animation_type == AnimationType.SIZE:
+        return delta_sizes
+
+    elif animation_type == AnimationType.OPACITY:
+        return delta_opacities
+
+    raise ValueError(f"Invalid animation type, got {animation_type}")
+
+
+def update_delta_state(entry: DeltaEntry, slot: int):
+    """
+    marks a delta entry as running or finished after a step of the animation in slot
+    """
+
+    frame_counter = store.frame_counter[slot]
+    duration = store.duration[slot]
+    loop = store.loop[slot]
+
+    if frame_counter < duration or loop != NO_LOOP_CODE:
+        entry.state = True
+
+    if loop == CYCLE_CODE and frame_counter == duration:
+        entry.state = False
+
+    if frame_counter == duration and not entry.state:
+        entry.state = False
+
+
+def is_written(entry: DeltaEntry, animation_type: AnimationType, value):
+    """
+    checks if the value was already written to the item, counts the
+    skipped write if so, otherwise remembers it as written
+    """
+
+    global skipped_writes
+
+    key = (entry.object_name, animation_type)
+
+    if written_values.get(key) == value:
+        skipped_writes += 1
+        written = True
+    else:
+        written_values[key] = value
+        written = False
+
+    # a finished entry is written from scratch on its next animation run
+    if entry.state is False:
+        del written_values[key]
+
+    return written
+
+
+def set_pos():
+    """
+    moves the item
+    """
+
+    apply_positions(collect_positions())
+
+
+def collect_positions():
+    """
+    returns the position writes of this frame as (tag, [x, y])
+    """
+
+    writes = [(tag, value) for tag, value in uncull(AnimationType.POSITION)]
+
+    for entry in list(delta_positions.values()):
+        if entry.state is None:
+            continue
+
+        elif entry.state:
+            x_int = int(entry.value[0])
+            y_int = int(entry.value[1])
+
+            entry.state = None
+
+        else:
+            x_int = round(entry.value[0])
+            y_int = round(entry.value[1])
+
+            del delta_positions[entry.object_name]
+
+        if is_culled(entry, AnimationType.POSITION, [x_int, y_int]):
+            continue
+
+        if not is_written(entry, AnimationType.POSITION, [x_int, y_int]):
+            writes.append((entry.object_name, [x_int, y_int]))
+
+    tags, values, _ = collect_batch(AnimationType.POSITION)
+    writes += zip(tags, values)
+
+    return writes
+
+
+def apply_positions(writes: list[tuple]):
+    for tag, pos in writes:
+        try:
+            dpg.set_item_pos(tag, pos)
+        except Exception:
+            if dpg.does_item_exist(tag):
+                raise
+            deleted_items.add(tag)  # purged with the next frame
+
+
+def set_size():
+    """
+    set items size
+    """
+
+    apply_sizes(collect_sizes())
+
+
+def collect_sizes():
+    """
+    returns the size writes of this frame as (tag, width, height)
+    """
+
+    writes = [(tag, value[0], value[1]) for tag, value in uncull(AnimationType.SIZE)]
+
+    for entry in list(delta_sizes.values()):
+        if entry.state is None:
+            continue
+
+        elif entry.state:
+            w_int = int(entry.value[0])
+            h_int = int(entry.value[1])
+
+            entry.state = None
+
+        else:
+            w_int = round(entry.value[0])
+            h_int = round(entry.value[1])
+
+            del delta_sizes[entry.object_name]
+
+        if is_culled(entry, AnimationType.SIZE, [w_int, h_int]):
+            continue
+
+        if not is_written(entry, AnimationType.SIZE, [w_int, h_int]):
+            writes.append((entry.object_name, w_int, h_int))
+
+    tags, values, _ = collect_batch(AnimationType.SIZE)
+    writes += [(tag, width, height) for tag, (width, height) in zip(tags, values)]
+
+    return writes
+
+
+def apply_sizes(writes: list[tuple]):
+    for tag, width, height in writes:
+        try:
+            dpg.configure_item(tag, width=width, height=height)
+        except Exception:
+            if dpg.does_item_exist(tag):
+                raise
+            deleted_items.add(tag)
+
+
+def dpg_get_alpha_style(item) -> OverlayTheme:
+    """
+    binds a pooled overlay theme to the item and returns it, the overlay is a copy of the
+    item's theme plus an alpha style, so items sharing that theme do not fade along
+    """
+
+    theme = dpg.get_item_theme(item)
+
+    overlay = overlay_themes.get(item)
+    if overlay is not None:
+        if theme == overlay.theme:
+            return overlay
+
+        # another theme got bound since, the overlay goes back to the pool
+        release_overlay_theme(item, rebind=False)
+
+    global clones_since_reclaim
+
+    pool = theme_pool.get(theme)
+    if not pool and clones_since_reclaim >= len(overlay_themes):
+        reclaim_overlay_themes()
+        clones_since_reclaim = 0
+        pool = theme_pool.get(theme)
+
+    if pool:
+        overlay = pool.pop()
+    else:
+        overlay = clone_theme(theme)
+        clones_since_reclaim += 1
+
+    overlay_themes[item] = overlay
+    dpg.bind_item_theme(item, overlay.theme)
+
+    return overlay
+
+
+def clone_theme(base_theme) -> OverlayTheme:
+    """
+    copies the components, colors and styles of a theme into a new overlay theme with an alpha style
+    """
+
+    theme = dpg.add_theme()
+    alpha_component = None
+
+    for component in dpg.get_item_children(base_theme, 1) if base_theme is not None else ():
+        configuration = dpg.get_item_configuration(component)
+        copy = dpg.add_theme_component(
+            configuration["item_type"],
+            parent=theme,
+            enabled_state=configuration.get("enabled_state", True),
+        )
+        if configuration["item_type"] == dpg.mvAll and configuration.get("enabled_state", True):
+            alpha_component = copy
+
+        for child in dpg.get_item_children(component, 1):
+            configuration = dpg.get_item_configuration(child)
+            category = configuration.get("category", dpg.mvThemeCat_Core)
+            value = dpg.get_value(child)
+
+            if dpg.get_item_type(child) == "mvAppItemType::mvThemeColor":
+                dpg.add_theme_color(configuration["target"], value, category=category, parent=copy)
+
+            # the overlay brings its own alpha
+            elif configuration["target"] != dpg.mvStyleVar_Alpha or category != dpg.mvThemeCat_Core:
+                dpg.add_theme_style(configuration["target"], value[0], value[1], category=category, parent=copy)
+
+    if alpha_component is None:
+        alpha_component = dpg.add_theme_component(dpg.mvAll, parent=theme)
+
+    alpha_style = dpg.add_theme_style(
+        dpg.mvStyleVar_Alpha,
+        1,
+        category=dpg.mvThemeCat_Core,
+        parent=alpha_component,
+    )
+
+    return OverlayTheme(theme, alpha_style, base_theme)
+
+
+def release_overlay_theme(item, rebind: bool = True):
+    """
+    returns the overlay theme of an item to the pool, rebind gives the item its own theme back
+    """
+
+    overlay = overlay_themes.pop(item, None)
+    if overlay is None:
+        return
+
+    if rebind:
+        dpg.bind_item_theme(item, overlay.base_theme if overlay.base_theme is not None else 0)
+
+    overlay.opacity = 1.0
+    theme_pool.setdefault(overlay.base_theme, []).append(overlay)
+
+
+def reclaim_overlay_themes():
+    """
+    returns the overlay themes of deleted items to the pool
+    """
+
+    for item in [item for item in overlay_themes if not dpg.does_item_exist(item)]:
+        release_overlay_theme(item, rebind=False)
+
+
+def invalidate_alpha_style(item=None):
+    """
+    forgets the cached alpha style of an item, or of all items,
+    call this after binding a new theme to an item while it fades
+    """
+
+    if item is None:
+        alpha_styles.clear()
+    else:
+        alpha_styles.pop(item, None)
+
+
+def invalidate_text_color(item=None):
+    """
+    forgets the cached rgb of a mvText item, or of all items,
+    call this after recoloring a text while it fades
+    """
+
+    if item is None:
+        text_colors.clear()
+    else:
+        text_colors.pop(item, None)
+
+
+def set_opacity():
+    """
+    set items opacity
+    """
+
+    apply_opacities(collect_opacities())
+
+
+def collect_opacities():
+    """
+    returns the opacity writes of this frame as (tag, opacity or None, finished),
+    None only lets a finished item forget its alpha style
+    """
+
+    writes = [
+        (tag, value, get_delta_entry(tag, AnimationType.OPACITY) is None)
+        for tag, value in uncull(AnimationType.OPACITY)
+    ]
+
+    for entry in list(delta_opacities.values()):
+        if entry.state is None:
+            continue
+
+        elif entry.state:
+            entry.state = None
+
+        else:
+            del delta_opacities[entry.object_name]
+
+        if is_culled(entry, AnimationType.OPACITY, entry.value):
+            continue
+
+        if not is_written(entry, AnimationType.OPACITY, entry.value):
+            writes.append((entry.object_name, entry.value, entry.state is False))
+
+        elif entry.state is False:
+            writes.append((entry.object_name, None, True))  # same value as last frame
+
+    writes += zip(*collect_batch(AnimationType.OPACITY))
+
+    return writes
+
+
+# summed fade steps may end a few ulps short of the end value
+OPAQUE_TOLERANCE = 1e-6
+
+
+def apply_opacities(writes: list[tuple]):
+    for tag, opacity, finished in writes:
+        try:
+            if opacity is None:
+                pass
+
+            elif tag in alpha_styles:
+                # the overlay outlives its item, so only dpg can tell that the item is gone
+                if not dpg.does_item_exist(tag):
+                    deleted_items.add(tag)
+                    continue
+
+                overlay = alpha_styles[tag]
+                dpg.set_value(overlay.alpha_style, [opacity])
+                overlay.opacity = opacity
+
+            else:
+                text_color = text_colors.get(tag)
+                if text_color is None:
+                    text_color = resolve_opacity_target(tag)
+
+                if text_color is None:
+                    overlay = alpha_styles[tag]
+                    dpg.set_value(overlay.alpha_style, [opacity])
+                    overlay.opacity = opacity
+                else:
+                    dpg.configure_item(tag, color=[*text_color, opacity * 255])
+
+            # the next animation run resolves the style again, in case the theme was rebound
+            if finished:
+                alpha_styles.pop(tag, None)
+                text_colors.pop(tag, None)
+
+                # fully opaque items need no overlay, they get their own theme back
+                overlay = overlay_themes.get(tag)
+                if overlay is not None and overlay.opacity >= 1 - OPAQUE_TOLERANCE:
+                    release_overlay_theme(tag)
+
+        except Exception:
+            if dpg.does_item_exist(tag):
+                raise
+            deleted_items.add(tag)
+
+
+def resolve_opacity_target(tag):
+    """
+    caches the rgb of a mvText item and returns it, or the alpha style of any other item and returns None
+    """
+
+    if dpg.get_item_type(tag) == "mvAppItemType::mvText":
+        color = dpg.get_item_configuration(tag)["color"]
+        text_colors[tag] = [int(channel * 255) for channel in color[:3]]
+        return text_colors[tag]
+
+    alpha_styles[tag] = dpg_get_alpha_style(tag)
+    return None
+
+
+# -----------------------------------------------------------------------------
+# 				Visibility Culling
+# -----------------------------------------------------------------------------
+
+
+@locked
+def set_culling(
+    enabled: bool = True,
+    predicate: callable | None = None,
+    types: tuple = (AnimationType.SIZE, AnimationType.OPACITY),
+):
+    """
+    skips the writes to items that are not visible, their animations keep running in time
+    and the current value is written once when the item shows up again,
+    predicate(tag) -> bool replaces dpg.is_item_visible, checked once per item and frame
+
+    position is left out by default, an item moving into view would never be written
+    """
+
+    global culled_types
+    global visibility_predicate
+
+    types = frozenset(AnimationType(animation_type) for animation_type in types)
+
+    # disabled culling writes all held back values with the next frame
+    culled_types = types if enabled else frozenset()
+    visibility_predicate = predicate
+
+
+def is_item_visible(tag) -> bool:
+    """
+    returns the visibility of an item, asking dpg or the predicate once per frame
+    """
+
+    visible = visible_items.get(tag)
+
+    if visible is None:
+        if visibility_predicate is not None:
+            visible = bool(visibility_predicate(tag))
+        elif dpg.does_item_exist(tag):
+            visible = dpg.is_item_visible(tag)
+        else:
+            # a deleted item is written, failing there purges its animations
+            visible = True
+        visible_items[tag] = visible
+
+    return visible
+
+
+def is_culled(entry: DeltaEntry, animation_type: AnimationType, value) -> bool:
+    """
+    checks if the write goes to a hidden item, if so the value is held back for uncull()
+    """
+
+    if animation_type not in culled_types or is_item_visible(entry.object_name):
+        return False
+
+    culled_values[animation_type][entry.object_name] = value
+    written_values.pop((entry.object_name, animation_type), None)  # written again once shown
+    return True
+
+
+def uncull(animation_type: AnimationType) -> list[tuple]:
+    """
+    returns (tag, value) of the held back values of items that are visible again
+    """
+
+    values = culled_values[animation_type]
+    if not values:
+        return []
+
+    writes = []
+
+    for tag in list(values):
+        if animation_type in culled_types and not is_item_visible(tag):
+            continue
+
+        value = values.pop(tag)
+
+        # an item that gets a new value this frame needs no extra write
+        entry = get_delta_entry(tag, animation_type)
+        if entry is None or entry.state is None:
+            writes.append((tag, value))
+
+    return writes
+
+
+# -----------------------------------------------------------------------------
+# 				Deleted Items
+# -----------------------------------------------------------------------------
+
+
+@locked
+def set_aborted_callback(callback: callable | None):
+    """
+    calls callback(object, animation name) for every animation purged because its item was deleted,
+    queued with the other callbacks of the frame
+    """
+
+    global aborted_callback
+    aborted_callback = callback
+
+
+# frames between two sweeps for deleted items of animations that do not write
+DELETED_SWEEP_INTERVAL = 60
+
+
+def sweep_deleted_items():
+    """
+    marks the deleted items of paused, scheduled and queued animations every few frames,
+    they write nothing, so no failing write finds them
+    """
+
+    global frames_since_sweep
+
+    frames_since_sweep += 1
+    if frames_since_sweep < DELETED_SWEEP_INTERVAL:
+        return
+    frames_since_sweep = 0
+
+    if not state_counts["paused"] and not state_counts["scheduled"]:
+        return
+
+    checked = set()
+    for animation in animations:
+        if animation.is_paused or animation not in active_animations:
+            for tag in animation.item_tags:
+                if tag not in checked:
+                    checked.add(tag)
+                    if not dpg.does_item_exist(tag):
+                        deleted_items.add(tag)
+
+
+def purge_deleted_items() -> tuple[list[tuple], list[str]]:
+    """
+    drops the animations of items deleted since the last frame together with their register entries,
+    a group loses its whole animation, returns the aborted (callback, object, animation name) events
+    and the purged items for release_purged_items()
+    """
+
+    global purged_animations
+
+    sweep_deleted_items()
+
+    if not deleted_items:
+        return [], []
+
+    # the render thread adds to the set while the worker purges it
+    tags = set(deleted_items)
+    deleted_items.difference_update(tags)
+
+    purged = {animation: None for tag in tags for animation in animations_by_tag.get(tag, ())}
+    events = []
+
+    for animation in purged:
+        drop_animation(animation)
+        if aborted_callback is not None:
+            events.append((aborted_callback, animation.object_name, animation.animation_name))
+
+    purged_animations += len(purged)
+
+    for tag in tags:
+        for animation_type in AnimationType:
+            discard_delta_entry(tag, animation_type)
+            culled_values[animation_type].pop(tag, None)
+
+        visible_items.pop(tag, None)
+
+    return events, list(tags)
+
+
+def release_purged_items(tags: list[str]):
+    """
+    drops the opacity caches of purged items and returns their overlays to the pool,
+    on the render thread, which reads them while applying a frame
+    """
+
+    for tag in tags:
+        alpha_styles.pop(tag, None)
+        text_colors.pop(tag, None)
+        release_overlay_theme(tag, rebind=False)
+
+
+# -----------------------------------------------------------------------------
+# 				Callback Dispatch
+# -----------------------------------------------------------------------------
+
+
+@locked
+def set_callback_dispatch(budget: float | None = None, workers: int = 0):
+    """
+    limits the time run() spends on callbacks to budget seconds per frame, the rest is carried over in order,
+    with workers > 0 callbacks marked with offload() run on a thread pool of that size
+    """
+
+    global callback_budget
+    global callback_pool
+
+    if budget is not None and budget < 0:
+        raise ValueError(f"Callback budget must not be negative, got {budget=}")
+
+    if workers < 0:
+        raise ValueError(f"Callback workers must not be negative, got {workers=}")
+
+    callback_budget = budget
+
+    if callback_pool is not None:
+        callback_pool.shutdown(wait=False)
+        callback_pool = None
+
+    if workers:
+        callback_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dearpygui_animate_callback")
+
+
+def offload(function: callable):
+    """
+    marks a callback that does not touch dpg to run on the callback thread pool, usable as decorator
+    """
+
+    offloaded_callbacks.add(function)
+    return function
+
+
+def dispatch_callbacks():
+    """
+    calls the queued callbacks in order until the budget of this frame is spent,
+    at least one callback runs per frame so the queue always drains
+    """
+
+    start = perf_counter()
+
+    while callback_queue:
+        func, obj_name, callback_data = callback_queue.popleft()
 
+        if callback_pool is not None and func in offloaded_callbacks:
+            callback_pool.submit(func, obj_name, callback_data)
+            continue
 
-@dataclass(slots=True)
-class Animation:
-    animation_name: str
-    animation_type: AnimationType  # either: position size opacity
-    object_name: str
-    start_value: any  # depends on animation type
-    distance: int
-    ease: list[float, float, float, float]
-    duration: int
-    starttime: float
-    frame_counter: int
-    last_ease: float
-    loop: AnimationLoopType  # either: ping-pong cycle continue
-    loop_counter: int
-    callback_function: any
-    callback_data: any
-    early_callback: any
-    early_callback_data: any
-    is_playing: bool
-    is_paused: bool
-    is_reversed: bool
+        func(obj_name, callback_data)
+
+        if callback_budget is not None and perf_counter() - start >= callback_budget:
+            break
 
 
 # -----------------------------------------------------------------------------
-# 				Main Functions
+# 				Background Compute
 # -----------------------------------------------------------------------------
 
 
-def add(
-    animation_type: AnimationType,
-    tag: str,
-    start_val,
-    end_val,
-    ease: list[float, float, float, float],
-    duration: int,
-    *,
-    name: str = "",
-    callback="",
-    callback_data="",
-    early_callback="",
-    early_callback_data="",
-    loop=AnimationLoopType.NO_LOOP,
-    timeoffset=0,
-):
+def set_threaded(enabled: bool = True):
     """
-    adds a new animation to animations register
+    advances the animations on a background thread while dpg renders the frame,
+    run() then only applies the writes prepared for it under dpg.mutex(),
+    changes made between two run() calls can show up to one frame later
     """
 
-    # fix min-values: smallest size window = 32x32, smallest size item = 1x1
-    if animation_type == AnimationType.SIZE:
-        if dpg.get_item_type(tag) == "mvAppItemType::Window":
-            if min(start_val) < 32:
-                warnings.warn(f"Minimum size for a window is 32 pixels, got {start_val=}")
+    global threaded
+    global worker
+    global worker_stop
+    global front_frame
+    global back_frame
+    global last_run_time
 
-            if min(end_val) < 32:
-                warnings.warn(f"Minimum size for a window is 32 pixels, got {start_val=}")
+    if enabled == threaded:
+        return
 
-            for i in range(2):
-                if start_val[i] < 32:
-                    start_val[i] = 32
+    if enabled:
+        # a frame left over from the last worker is still shown by the next run()
+        if not frame_pending:
+            front_frame = FrameBuffer([], [], [], [], [])
+            back_frame = FrameBuffer([], [], [], [], [])
+            last_run_time = None
+            frame_requested.clear()
+            frame_ready.clear()
 
-                elif end_val[i] < 32:
-                    end_val[i] = 32
-        else:
-            if min(start_val) < 32:
-                warnings.warn(f"Minimum size for a widget is 1 pixel, got {start_val=}")
+        worker_stop = False
+        worker = threading.Thread(target=worker_loop, name="dearpygui_animate", daemon=True)
+        worker.start()
+        threaded = True
+        return
 
-            if min(end_val) < 32:
-                warnings.warn(f"Minimum size for a widget is 1 pixel, got {start_val=}")
+    threaded = False
 
-            for i in range(2):
-                if start_val[i] < 1:
-                    start_val[i] = 1
+    # the pending frame already advanced the animations, the next run() applies it instead of computing one
+    if frame_pending:
+        frame_ready.wait()
 
-                elif end_val[i] < 1:
-                    end_val[i] = 1
+    worker_stop = True
+    frame_requested.set()
+    worker.join()
+    worker = None
 
-    # rewrite end_val to distance, all calculations are based on distance
-    try:
-        distance = [end_val[0] - start_val[0], end_val[1] - start_val[1]]
-    except Exception:
-        distance = end_val - start_val
 
-    new_animation = Animation(
-        animation_name=name,
-        animation_type=animation_type,
-        object_name=tag,
-        start_value=start_val,
-        distance=distance,
-        ease=ease,
-        duration=duration,
-        callback_function=callback,
-        callback_data=callback_data,
-        early_callback=early_callback,
-        early_callback_data=early_callback_data,
-        loop=loop,
-        starttime=(dpg.get_total_time() + timeoffset),
-        is_playing=False,
-        is_paused=False,
-        is_reversed=False,
-        loop_counter=0,
-        last_ease=0,
-        frame_counter=0,
-    )
+def worker_loop():
+    """
+    computes one frame into the back frame whenever run() asks for it,
+    an error is handed to run() instead of ending the thread
+    """
 
-    global animations
-    animations.append(new_animation)
+    global worker_error
 
+    while True:
+        frame_requested.wait()
+        frame_requested.clear()
 
-def run():
-    """
-    Animation data-set layout:
+        if worker_stop:
+            return
 
-    animation[0] = animation name
-    animation[1] = animation type
-    animation[2] = object name
-    animation[3] = start value
-    animation[4] = distance
-    animation[5] = ease
-    animation[6] = duration
-    animation[7] = starttime
-    animation[8] = frame counter
-    animation[9] = last ease
-    animation[10] = loop
-    animation[11] = loop counter
-    animation[12] = callback function
-    animation[13] = function data
-    animation[14] = early callback
-    animation[15] = early callback data
-    animation[16] = is_playing
-    animation[17] = is_paused
-    animation[18] = is_reversed
+        with engine_lock:
+            try:
+                compute_frame(back_frame, frame_target)
+            except Exception as error:
+                worker_error = error
+
+        frame_ready.set()
+
+
+def compute_frame(frame: FrameBuffer, now: float):
+    """
+    advances all animations to now and collects the writes and callbacks of the frame
     """
 
-    animations_updated: list[Animation] = []
-    callbacks = {}
-    global animations
+    global skipped_writes
+    global completed_animations
+    global ease_frame
+    skipped_writes = 0
+    completed_animations = 0
+    ease_frame += 1
+    visible_items.clear()
+    frame.callbacks, frame.purged = purge_deleted_items()
 
-    for animation in animations:
-        if dpg.get_total_time() >= animation.starttime and not animation.is_paused:
+    start_scheduled_animations(now)
 
-            if animation.early_callback and animation.frame_counter == 0:
-                callbacks[animation.early_callback] = (
-                    animation.object_name,
-                    animation.early_callback_data,
-                )
+    if batch_mode:
+        frame.callbacks += advance_batch(now)
+    else:
+        frame.callbacks += advance_animations(now)
 
-            animation.is_playing = True
-            frame = animation.frame_counter / animation.duration
+    frame.positions = collect_positions()
+    frame.sizes = collect_sizes()
+    frame.opacities = collect_opacities()
+    frame.completed = completed_animations
 
-            ease = bezier_transition(frame, animation.ease)
 
-            if animation.animation_type == AnimationType.POSITION:
-                add_delta_positions(animation, ease)
+def swap_frames():
+    """
+    waits for the worker, swaps its frame to the front and lets it start on the next one,
+    returns the front frame
+    """
 
-            elif animation.animation_type == AnimationType.SIZE:
-                add_delta_sizes(animation, ease)
+    global front_frame
+    global back_frame
+    global frame_pending
+    global frame_target
+    global last_run_time
+    global worker_error
 
-            elif animation.animation_type == AnimationType.OPACITY:
-                add_delta_opacities(animation, ease)
-            
-            else:
-                raise ValueError(f"Invalid animation type, got {animation.animation_type}")
+    now = dpg.get_total_time()
 
-            animation.last_ease = ease
+    if not frame_pending:
+        frame_target = now
+        frame_pending = True
+        frame_requested.set()
 
-            if animation.frame_counter < animation.duration:
-                if not animation.is_reversed:
-                    animation.frame_counter += 1
-                else:
-                    if animation.frame_counter == 0:
-                        animation.is_reversed = False
-                        animation.frame_counter = 1
-                    else:
-                        animation.frame_counter -= 1
-                animations_updated.append(animation)
+    frame_ready.wait()
+    frame_ready.clear()
 
-            elif animation.frame_counter == animation.duration:
-                if animation.loop:
-                    animations_updated.append(set_loop(animation))
+    # the failed frame is dropped, the next run() asks for a new one like run() without the worker
+    if worker_error is not None:
+        error, worker_error = worker_error, None
+        frame_pending = False
+        raise error
 
-                if animation.callback_function:
-                    callbacks[animation.callback_function] = (
-                        animation.object_name,
-                        animation.callback_data,
-                    )
+    front_frame, back_frame = back_frame, front_frame
 
-        else:
-            animations_updated.append(animation)
+    if not threaded:
+        frame_pending = False
+        return front_frame
 
-    set_pos()
-    set_size()
-    set_opacity()
+    # the next frame is expected one frame interval from now
+    frame_target = now + (now - last_run_time if last_run_time is not None else 0)
+    last_run_time = now
+    frame_requested.set()
 
-    animations = animations_updated
+    return front_frame
 
-    for func, (obj_name, callback_data) in callbacks.items():
-        func(obj_name, callback_data)
 
+# -----------------------------------------------------------------------------
+# 				Profiling
+# -----------------------------------------------------------------------------
+
+EASE_PHASE = PROFILE_PHASES.index("ease")
+DELTA_PHASE = PROFILE_PHASES.index("delta")
+
+# functions of the scalar engine timed per call while profiling, by phase
+PROFILED_FUNCTIONS = {
+    "cached_bezier_transition": EASE_PHASE,
+    "add_delta_positions": DELTA_PHASE,
+    "add_delta_sizes": DELTA_PHASE,
+    "add_delta_opacities": DELTA_PHASE,
+}
 
-def play(animation_name: str):
+
+@locked
+def set_profiling(enabled: bool = True, capacity: int = 1024):
     """
-    resumes an animation
+    times every phase of run() and keeps the last capacity frames in a ring buffer,
+    disabled profiling costs a few no-op calls per frame, enabling starts a new recording
     """
 
-    global animations
+    if capacity < 1:
+        raise ValueError(f"Profile capacity must be at least 1, got {capacity}")
 
-    for animation in animations:
-        if animation.animation_name == animation_name:
-            animation.is_paused = False
+    global profiling
+    global profile_capacity
+    global profile_buffer
+    global profile_frames
 
+    # restore the plain functions, then wrap them again if enabled
+    globals().update(profiled_functions)
+    profiled_functions.clear()
 
-def pause(animation_name: str):
-    """
-    pauses an animation
-    """
+    if enabled:
+        for name, phase in PROFILED_FUNCTIONS.items():
+            profiled_functions[name] = globals()[name]
+            globals()[name] = profiled_function(profiled_functions[name], phase)
 
-    global animations
+    profiling = enabled
+    profile_laps[:] = [0.0] * len(PROFILE_PHASES)
 
-    for animation in animations:
-        if animation.animation_name == animation_name:
-            animation.is_paused = True
+    # disabling keeps the recorded frames for get_profile_stats() and export_profile()
+    if enabled:
+        profile_capacity = capacity
+        profile_buffer = array("d", bytes(8 * capacity * len(PROFILE_PHASES)))
+        profile_frames = 0
 
 
-def remove(animation_name: str):
+def profiled_function(function, phase: int):
     """
-    removes an animation from animations register
+    wraps a function to add its duration to a phase of the current frame
     """
 
-    animations_updated = []
-    delta_positions_updated = []
-    delta_sizes_updated = []
-    delta_opacities_updated = []
-    object_anitype = []
-    global animations
-    global delta_positions
-    global delta_sizes
-    global delta_opacities
+    def wrapper(*args):
+        start = perf_counter()
+        result = function(*args)
+        profile_laps[phase] += perf_counter() - start
+        return result
 
-    for animation in animations:
-        if not animation.animation_name == animation_name:
-            animations_updated.append(animation)
-        else:
-            object_anitype = [animation.object_name, animation.animation_type]
-
-    if object_anitype:
-        found = False
-        for ani in animations_updated:
-            if (
-                ani.object_name == object_anitype[0]
-                and ani.animation_type == object_anitype[1]
-            ):
-                found = True
-                break
+    wrapper.__wrapped__ = function
+    return wrapper
 
-        if not found:
-            if object_anitype[1] == AnimationType.POSITION:
-                for entry in delta_positions:
-                    if not entry[0] == object_anitype[0]:
-                        delta_positions_updated.append(entry)
-                delta_positions = delta_positions_updated
-
-            elif object_anitype[1] == AnimationType.SIZE:
-                for entry in delta_sizes:
-                    if not entry[0] == object_anitype[0]:
-                        delta_sizes_updated.append(entry)
-                delta_sizes = delta_sizes_updated
-
-            elif object_anitype[1] == AnimationType.OPACITY:
-                for entry in delta_opacities:
-                    if not entry[0] == object_anitype[0]:
-                        delta_opacities_updated.append(entry)
-                delta_opacities = delta_opacities_updated
-            
-            else:
-                raise ValueError(f"Invalid animation type, got {animation.animation_type}")
 
+def add_phase_time(phase: int, since: float):
+    """
+    adds the time since a lap to a phase of the current frame, returns the new lap
+    """
 
-    animations = animations_updated
+    now = perf_counter()
+    profile_laps[phase] += now - since
+    return now
 
 
-def get(*args):
+def record_profile(laps: list[float]):
     """
-    return animation data as requested
+    writes the phase times of the finished frame into the ring buffer
     """
 
-    return_data = []
-    global animations
+    global profile_frames
 
-    for animation in animations:
-        for entry in args:
-            if entry == "name":
-                return_data.append(animation.animation_name)
+    frame = profile_laps
+    frame[0] = laps[-1] - laps[0]
+    frame[1] = laps[1] - laps[0]
+    frame[2] = laps[2] - laps[1]
+    frame[5] = laps[3] - laps[2]
+    frame[6] = laps[4] - laps[3]
+    frame[7] = laps[5] - laps[4]
+    frame[8] = laps[6] - laps[5]
 
-            if entry == "type":
-                return_data.append(animation.animation_type)
+    width = len(PROFILE_PHASES)
+    offset = profile_frames % profile_capacity * width
+    profile_buffer[offset : offset + width] = array("d", frame)
+    profile_frames += 1
 
-            if entry == "object":
-                return_data.append(animation.object_name)
+    frame[:] = [0.0] * width
 
-            if entry == "startval":  # Don't touch str, backwards compatibility
-                return_data.append(animation.start_value)
 
-            if entry == "endval":  # Don't touch str, backwards compatibility
-                try:
-                    end_val = [
-                        animation.start_value[0] + animation.distance[0],
-                        animation.start_value[1] + animation.distance[1],
-                    ]
-                except Exception:
-                    end_val = animation.start_value + animation.distance
-                return_data.append(end_val)
+def get_profile():
+    """
+    returns the recorded frames, oldest first, as dicts of phase -> seconds
+    """
 
-            if entry == "ease":
-                return_data.append(animation.ease)
+    width = len(PROFILE_PHASES)
+    count = min(profile_frames, profile_capacity)
+    first = profile_frames - count
 
-            if entry == "duration":
-                return_data.append(animation.duration)
+    frames = []
+    for frame in range(first, profile_frames):
+        offset = frame % profile_capacity * width
+        frames.append(dict(zip(PROFILE_PHASES, profile_buffer[offset : offset + width])))
 
-            if entry == "starttime":
-                return_data.append(animation.starttime)
+    return frames
 
-            if entry == "framecounter":  # Don't touch str, backwards compatibility
-                return_data.append(animation.frame_counter)
 
-            if entry == "loop":
-                return_data.append(animation.loop)
+def get_profile_stats(percentiles: tuple[float, ...] = (50, 99)):
+    """
+    returns the nearest rank percentiles, mean and max of every phase in seconds
+    """
 
-            if entry == "loopcounter":  # Don't touch str, backwards compatibility
-                return_data.append(animation.loop_counter)
+    frames = get_profile()
+    stats = {}
 
-            if entry == "callback":
-                return_data.append(animation.callback_function)
+    for phase in PROFILE_PHASES:
+        samples = sorted(frame[phase] for frame in frames)
+        if not samples:
+            stats[phase] = {}
+            continue
 
-            if entry == "callback_data":
-                return_data.append(animation.callback_data)
+        stats[phase] = {
+            f"p{p:g}": samples[min(len(samples) - 1, max(0, round(p / 100 * len(samples)) - 1))]
+            for p in percentiles
+        }
+        stats[phase]["mean"] = sum(samples) / len(samples)
+        stats[phase]["max"] = samples[-1]
 
-            if entry == "early_callback":
-                return_data.append(animation.early_callback)
+    return stats
 
-            if entry == "early_callback_data":
-                return_data.append(animation.early_callback_data)
 
-            if entry == "isplaying":  # Don't touch str, backwards compatibility
-                return_data.append(animation.is_paused)
+def export_profile(path: str, file_format: str | None = None):
+    """
+    writes the recorded frames to a csv or json file, by default chosen by the file extension
+    """
 
-            if entry == "ispaused":  # Don't touch str, backwards compatibility
-                return_data.append(animation.is_paused)
+    if file_format is None:
+        file_format = "csv" if str(path).endswith(".csv") else "json"
 
-    if not return_data:
-        return False
+    if file_format == "csv":
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=PROFILE_PHASES)
+            writer.writeheader()
+            writer.writerows(get_profile())
 
-    return return_data
+    elif file_format == "json":
+        with open(path, "w") as file:
+            json.dump(
+                {"phases": PROFILE_PHASES, "frames": get_profile(), "stats": get_profile_stats()},
+                file,
+                indent=2,
+            )
+
+    else:
+        raise ValueError(f"Invalid profile format, got {file_format}")
 
 
 # -----------------------------------------------------------------------------
-# 				Helper Functions
+# 				Batch Engine
 # -----------------------------------------------------------------------------
 
-
-def bezier_transition(search: int, handles: list[float, float, float, float]):
+# array columns of the batch state and their dtypes
+BATCH_ARRAYS = {
+    "store_slot": "intp",
+    "slot_index": "intp",
+    "ease_index": "intp",
+    "starttime": "float64",
+    "duration": "float64",
+    "distance": "float64",
+    "frame_counter": "float64",
+    "last_ease": "float64",
+    "is_playing": "bool",
+    "is_paused": "bool",
+    "is_removed": "bool",
+    "is_reversed": "bool",
+    "is_looping": "bool",
+    "is_cycle": "bool",
+    "is_timed": "bool",
+    "has_early_callback": "bool",
+    "is_track": "bool",
+    "is_group": "bool",
+    "is_blended": "bool",
+}
+
+
+@locked
+def set_batch_mode(enabled: bool = True):
     """
-    solving y (progress) of bezier curve for given x (time)
-    using the newton-raphson method
+    switches run() to the numpy batch engine, which keeps the animations
+    register in arrays and evaluates every animation of a frame in one pass
     """
 
-    h1x, h1y, h2x, h2y = handles
+    if enabled and np is None:
+        raise ImportError("The batch engine requires numpy, install it with 'pip install numpy'")
 
-    cx = 3 * h1x
-    bx = 3 * (h2x - h1x) - cx
-    ax = 1 - cx - bx
+    global batch_mode
+    global batch_state
+    global batch_stale
 
-    t = search
+    sync_batch()
+    export_batch_items()
+    batch_mode = enabled
+    batch_state = None
+    batch_stale = True
 
-    for i in range(100):
-        x = (ax * t**3 + bx * t**2 + cx * t) - search
 
-        if round(x, 4) == 0:
-            break
+def build_batch():
+    """
+    rebuilds the batch arrays from the active animations
+    """
 
-        dx = 3.0 * ax * t**2 + 2.0 * bx * t + cx
+    global batch_state
+    global batch_stale
+
+    sync_batch()
+    export_batch_items()
+
+    batch_state = BatchState(
+        animations=[],
+        rows={},
+        slots={},
+        slot_keys=[],
+        group_slots={},
+        item_type=np.zeros(0, dtype=np.int8),
+        item_value=np.zeros((0, 2)),
+        item_state=np.zeros(0, dtype=np.int8),
+        item_written=np.zeros((0, 2)),
+        eases={},
+        ease_table=np.zeros((0, ease_table_resolution + 1)),
+        **{name: np.zeros(0, dtype=dtype) for name, dtype in BATCH_ARRAYS.items()},
+    )
+    batch_state.distance = np.zeros((0, 2))
 
-        t -= x / dx
+    append_batch(batch_state, list(active_animations))
+    batch_pending.clear()
+    batch_stale = False
 
-    return 3 * t * (1 - t) ** 2 * h1y + 3 * t**2 * (1 - t) * h2y + t**3
 
+def append_batch(state: BatchState, new_animations: list[Animation]):
+    """
+    appends rows for newly started animations to the batch arrays,
+    gathering their columns straight from the animation store
+    """
 
-def set_loop(animation: Animation):
+    if not new_animations:
+        return
+
+    store_slot = np.fromiter((a.slot for a in new_animations), dtype=np.intp, count=len(new_animations))
+
+    def gather(name):
+        column = getattr(store, name)
+        return np.frombuffer(column, dtype=column.typecode)[store_slot]  # fancy indexing copies
+
+    slot_count = len(state.slot_keys)
+    slot_index = []
+    for type_code, row_slot in zip(gather("animation_type").tolist(), store_slot.tolist()):
+        animation_type = ANIMATION_TYPES[type_code]
+        slot_index.append(batch_slot(state, animation_type, store.object_name[row_slot]))
+
+        group = store.groups.get(row_slot)
+        if group is not None:
+            state.group_slots[row_slot] = np.array(
+                [batch_slot(state, animation_type, tag) for tag in group.tags], dtype=np.intp
+            )
+
+    if len(state.slot_keys) > slot_count:
+        import_delta_entries(state, slot_count)
+
+    ease_ids = gather("ease")
+    new_eases = []
+    for ease_id in np.unique(ease_ids).tolist():
+        if ease_id not in state.eases:
+            state.eases[ease_id] = len(state.eases)
+            curve = store.ease_curves[ease_id]
+            table = get_ease_table(curve)
+            new_eases.append(table if table is not None else sample_ease_table(curve))
+
+    ease_lookup = np.zeros(len(store.ease_curves), dtype=np.intp)
+    ease_lookup[list(state.eases)] = list(state.eases.values())
+
+    loop = gather("loop")
+    columns = {
+        "store_slot": store_slot,
+        "slot_index": slot_index,
+        "ease_index": ease_lookup[ease_ids],
+        "starttime": gather("starttime"),
+        "duration": gather("duration"),
+        "distance": np.column_stack((gather("distance_x"), gather("distance_y"))),
+        "frame_counter": gather("frame_counter"),
+        "last_ease": gather("last_ease"),
+        "is_playing": gather("is_playing"),
+        "is_paused": gather("is_paused"),
+        "is_removed": np.zeros(len(new_animations), dtype=bool),
+        "is_reversed": gather("is_reversed"),
+        "is_looping": loop != NO_LOOP_CODE,
+        "is_cycle": loop == CYCLE_CODE,
+        "is_timed": gather("timing") == SECONDS_CODE,
+        "has_early_callback": [bool(a.early_callback) for a in new_animations],
+        "is_track": [slot in store.tracks for slot in store_slot.tolist()],
+        "is_group": [slot in store.groups for slot in store_slot.tolist()],
+        "is_blended": [slot in store.blends for slot in store_slot.tolist()],
+    }
+
+    for name, dtype in BATCH_ARRAYS.items():
+        column = np.asarray(columns[name], dtype=dtype)
+        setattr(state, name, np.concatenate((getattr(state, name), column)))
+
+    if new_eases:
+        state.ease_table = np.vstack((state.ease_table, new_eases))
+
+    for animation in new_animations:
+        state.rows[id(animation)] = len(state.animations)
+        state.animations.append(animation)
+
+
+def batch_slot(state: BatchState, animation_type: AnimationType, object_name) -> int:
     """
-    prepare animation for next loop iteration
+    returns the slot of an item and animation type in the batch sums, adding it if needed
     """
 
-    if animation.loop == AnimationLoopType.PING_PONG:
-        animation.is_reversed = True
-        animation.frame_counter -= 1
-        animation.last_ease = 1
+    key = (animation_type, object_name)
+    slot = state.slots.get(key)
 
-    elif animation.loop == AnimationLoopType.CYCLE:
-        animation.frame_counter = 0
-        animation.last_ease = 0
+    if slot is None:
+        slot = state.slots[key] = len(state.slot_keys)
+        state.slot_keys.append(key)
 
-    elif animation.loop == AnimationLoopType.CONTINUE:
-        try:
-            animation.start_value = [
-                animation.start_value[0] + animation.distance[0],
-                animation.start_value[1] + animation.distance[1],
-            ]
-        except Exception:
-            animation.start_value += animation.distance
-        animation.frame_counter = 0
-        animation.last_ease = 0
-    
-    elif animation.loop == AnimationLoopType.NO_LOOP:
-        pass
-    
-    else:
-        raise ValueError(f"Invalid animation loop type, got {animation.loop}")
+    return slot
 
-    animation.loop_counter += 1
-    return animation
 
+# states of the delta entries in the batch arrays, see DeltaEntry.state
+NO_ENTRY = -1
+ENTRY_IDLE = 0  # None
+ENTRY_RUNNING = 1  # True
+ENTRY_FINISHED = 2  # False
+DELTA_STATES = (None, True, False)  # DeltaEntry.state by code
 
-def add_delta_positions(animation: Animation, ease: float):
+
+def batch_item_slot(tag, animation_type: AnimationType) -> int | None:
     """
-    collects delta movements of all position animations for a certain item
+    returns the slot of an item and animation type in the batch arrays, None if they do not hold it
     """
 
-    global delta_positions
+    if batch_state is None:
+        return None
 
-    for item in delta_positions:
-        if animation.object_name == item[0]:
+    return batch_state.slots.get((animation_type, tag))
 
-            x_step = animation.distance[0] * (ease - animation.last_ease)
-            y_step = animation.distance[1] * (ease - animation.last_ease)
 
-            item[1] += x_step
-            item[2] += y_step
+def import_delta_entries(state: BatchState, first: int):
+    """
+    grows the item arrays by the slots from first on and moves the delta entries
+    and written values the registers hold for their items into them
+    """
 
-            if animation.frame_counter < animation.duration or animation.loop:
-                item[3] = True
+    keys = state.slot_keys[first:]
+    count = len(keys)
 
-            if (
-                animation.loop == AnimationLoopType.CYCLE
-                and animation.frame_counter == animation.duration
-            ):
-                item[3] = False
+    item_type = np.array([ANIMATION_TYPES.index(animation_type) for animation_type, _ in keys], dtype=np.int8)
+    item_value = np.zeros((count, 2))
+    item_state = np.full(count, NO_ENTRY, dtype=np.int8)
+    item_written = np.full((count, 2), np.nan)
 
-            if animation.frame_counter == animation.duration and not item[3]:
-                item[3] = False
+    if delta_positions or delta_sizes or delta_opacities or written_values:
+        for index, (animation_type, tag) in enumerate(keys):
+            opacity = animation_type == AnimationType.OPACITY
 
-            break
-    else:
-        delta_positions.append(
-            [
-                animation.object_name,
-                animation.start_value[0],
-                animation.start_value[1],
-                True,
-            ]
-        )
+            entry = get_delta_register(animation_type).pop(tag, None)
+            if entry is not None:
+                item_value[index] = (entry.value, 0.0) if opacity else entry.value
+                item_state[index] = DELTA_STATES.index(entry.state)
+
+            written = written_values.pop((tag, animation_type), None)
+            if written is not None:
+                item_written[index, : 1 if opacity else 2] = written
 
+    state.item_type = np.concatenate((state.item_type, item_type))
+    state.item_value = np.concatenate((state.item_value, item_value))
+    state.item_state = np.concatenate((state.item_state, item_state))
+    state.item_written = np.concatenate((state.item_written, item_written))
 
-def add_delta_sizes(animation: Animation, ease: float):
+
+def export_batch_items():
     """
-    collects delta movements of all size animations for a certain item
+    moves the delta entries and written values of the batch arrays back to the registers
     """
 
-    global delta_sizes
+    if batch_state is None:
+        return
 
-    for item in delta_sizes:
-        if animation.object_name == item[0]:
-            w_step = animation.distance[0] * (ease - animation.last_ease)
-            h_step = animation.distance[1] * (ease - animation.last_ease)
+    state = batch_state
 
-            item[1] += w_step
-            item[2] += h_step
+    for slot in np.flatnonzero(state.item_state != NO_ENTRY).tolist():
+        animation_type, tag = state.slot_keys[slot]
+        value = state.item_value[slot].tolist()
+        get_delta_register(animation_type)[tag] = DeltaEntry(
+            tag,
+            value[0] if animation_type == AnimationType.OPACITY else value,
+            DELTA_STATES[state.item_state[slot]],
+        )
 
-            if animation.frame_counter < animation.duration or animation.loop:
-                item[3] = True
+    for slot in np.flatnonzero(~np.isnan(state.item_written[:, 0])).tolist():
+        animation_type, tag = state.slot_keys[slot]
+        written = state.item_written[slot].tolist()
+        if animation_type == AnimationType.OPACITY:
+            written_values[(tag, animation_type)] = written[0]
+        else:
+            written_values[(tag, animation_type)] = [int(written[0]), int(written[1])]
 
-            if (
-                animation.loop == AnimationLoopType.CYCLE
-                and animation.frame_counter == animation.duration
-            ):
-                item[3] = False
+    state.item_state[:] = NO_ENTRY
+    state.item_written[:] = np.nan
 
-            if animation.frame_counter == animation.duration and not item[3]:
-                item[3] = False
 
-            break
-    else:
-        delta_sizes.append(
-            [
-                animation.object_name,
-                animation.start_value[0],
-                animation.start_value[1],
-                True,
-            ]
-        )
+def batch_item_tags(animation_type: AnimationType, written: bool = False) -> list:
+    """
+    returns the items of a type the batch arrays hold a delta entry for, or a written value
+    """
+
+    if batch_state is None:
+        return []
+
+    state = batch_state
+    held = ~np.isnan(state.item_written[:, 0]) if written else state.item_state != NO_ENTRY
+    slots = np.flatnonzero(held & (state.item_type == ANIMATION_TYPES.index(animation_type)))
+
+    return [state.slot_keys[slot][1] for slot in slots.tolist()]
 
 
-def add_delta_opacities(animation: Animation, ease: float):
+def collect_batch(animation_type: AnimationType) -> tuple[list, list, list]:
     """
-    collects delta movements of all opacity animations for a certain item
+    collects the writes of the batch items of a type like the collect functions do with
+    the registers, returns the tags, values and finished flags of the changed writes,
+    only these become python objects
     """
 
-    global delta_opacities
+    global skipped_writes
+
+    state = batch_state
+    if state is None:
+        return [], [], []
 
-    for item in delta_opacities:
-        if animation.object_name == item[0]:
-            o_step = animation.distance * (ease - animation.last_ease)
+    opacity = animation_type == AnimationType.OPACITY
+    pending = (state.item_state > ENTRY_IDLE) & (state.item_type == ANIMATION_TYPES.index(animation_type))
+    slots = np.flatnonzero(pending)
 
-            item[1] += o_step
+    if not len(slots):
+        return [], [], []
 
-            if animation.frame_counter < animation.duration or animation.loop:
-                item[2] = True
+    finished = state.item_state[slots] == ENTRY_FINISHED
+    state.item_state[slots] = np.where(finished, NO_ENTRY, ENTRY_IDLE)
 
-            if (
-                animation.loop == AnimationLoopType.CYCLE
-                and animation.frame_counter == animation.duration
-            ):
-                item[2] = False
+    if opacity:
+        values = state.item_value[slots, :1]
+    else:
+        values = state.item_value[slots]
+        values = np.where(finished[:, None], np.round(values), np.trunc(values))
 
-            if animation.frame_counter == animation.duration and not item[2]:
-                item[2] = False
+    # hidden items hold their value back for uncull() and are written again once shown
+    if animation_type in culled_types:
+        tags = [state.slot_keys[slot][1] for slot in slots.tolist()]
+        hidden = ~np.fromiter(map(is_item_visible, tags), dtype=bool, count=len(tags))
 
-            break
+        for index in np.flatnonzero(hidden).tolist():
+            value = values[index].tolist()
+            culled_values[animation_type][tags[index]] = value[0] if opacity else [int(v) for v in value]
+
+        state.item_written[slots[hidden]] = np.nan
+        slots, values, finished = slots[~hidden], values[~hidden], finished[~hidden]
+
+    columns = values.shape[1]
+    same = (state.item_written[slots, :columns] == values).all(axis=1)
+    skipped_writes += int(same.sum())
+
+    # a finished item is written from scratch on its next animation run
+    state.item_written[slots, :columns] = values
+    state.item_written[slots[finished]] = np.nan
+
+    # a finished opacity still lets the item forget its alpha style
+    changed = ~same | finished if opacity else ~same
+    tags = [state.slot_keys[slot][1] for slot in slots[changed].tolist()]
+
+    if opacity:
+        values = np.where(same[changed], None, values[changed, 0]).tolist()
     else:
-        delta_opacities.append([animation.object_name, animation.start_value, True])
+        values = values[changed].astype(np.int64).tolist()
 
+    return tags, values, finished[changed].tolist()
 
-def set_pos():
+# batch columns written back to the store, their values change while running
+BATCH_SYNCED = ("frame_counter", "starttime", "last_ease", "is_playing", "is_paused", "is_reversed")
+
+
+def retarget_batch_row(state: BatchState, row: int):
     """
-    moves the item
+    reads the way of a retargeted animation into its batch row
     """
 
-    global delta_positions
+    slot = int(state.store_slot[row])
+    state.duration[row] = store.duration[slot]
+    state.distance[row] = store.distance_x[slot], store.distance_y[slot]
+    state.is_blended[row] = slot in store.blends
 
-    items_updated = []
 
-    for item in delta_positions:
-        if item[3] is None:
-            items_updated.append(item)
-            continue
+def sync_batch():
+    """
+    writes the batch arrays back to the animation store in one pass per column
+    """
 
-        elif item[3]:
-            x_int = int(item[1])
-            y_int = int(item[2])
+    if batch_state is None or not batch_state.animations:
+        return
 
-            item[3] = None
+    for name in BATCH_SYNCED:
+        column = getattr(store, name)
+        view = np.frombuffer(column, dtype=column.typecode)
+        view[batch_state.store_slot] = getattr(batch_state, name)
+        del view  # a column cannot grow while a view exports its buffer
 
-            items_updated.append(item)
 
-        else:
-            x_int = round(item[1])
-            y_int = round(item[2])
+def write_batch_row(state: BatchState, row: int):
+    """
+    writes one row of the batch arrays back to the animation store
+    """
+
+    slot = int(state.store_slot[row])
+    for name in BATCH_SYNCED:
+        getattr(store, name)[slot] = getattr(state, name)[row].item()
 
-        dpg.set_item_pos(item[0], [x_int, y_int])
 
-    delta_positions = items_updated
+def read_batch_row(state: BatchState, row: int):
+    """
+    reads one row of the batch arrays from the animation store
+    """
 
+    slot = int(state.store_slot[row])
+    for name in BATCH_SYNCED:
+        getattr(state, name)[row] = getattr(store, name)[slot]
 
-def set_size():
+
+def advance_batch(now: float):
     """
-    set items size
+    advances all active animations by one frame in one vectorized pass and
+    collects their deltas, returns the (callback, object, data) events of this frame in order
     """
 
-    global delta_sizes
+    global completed_animations
 
-    items_updated = []
+    if batch_stale or batch_state is None:
+        build_batch()
 
-    for item in delta_sizes:
-        if item[3] is None:
-            items_updated.append(item)
-            continue
+    state = batch_state
 
-        elif item[3]:
-            w_int = int(item[1])
-            h_int = int(item[2])
+    if batch_pending:
+        append_batch(
+            state,
+            [
+                animation
+                for animation in dict.fromkeys(batch_pending)
+                if animation in active_animations and id(animation) not in state.rows
+            ],
+        )
+        batch_pending.clear()
 
-            item[3] = None
+    if state.is_removed.any():
+        compact_batch(state, state.is_removed)
 
-            items_updated.append(item)
+    count = len(state.animations)
 
-        else:
-            w_int = round(item[1])
-            h_int = round(item[2])
+    if not count:
+        return []
 
-        dpg.set_item_width(item[0], w_int)
-        dpg.set_item_height(item[0], h_int)
+    due = ~state.is_paused
+    if not due.any():
+        return []
 
-    delta_sizes = items_updated
+    # the clock may stay on 0 for a frame, so timed rows start on is_playing
+    early = due & state.has_early_callback & np.where(
+        state.is_timed, ~state.is_playing, state.frame_counter == 0
+    )
+    state.is_playing |= due
 
+    # timed rows take their progress from the clock
+    timed = due & state.is_timed
+    elapsed = np.minimum(now - state.starttime, state.duration)
+    state.frame_counter[timed] = np.where(
+        state.is_reversed, state.duration - elapsed, elapsed
+    )[timed]
 
-def dpg_get_alpha_style(item):
-    theme = dpg.get_item_theme(item)
-    if theme is None:
-        theme = dpg.add_theme()
-        theme_component = dpg.add_theme_component(dpg.mvAll, parent=theme)
-        alpha_style = dpg.add_theme_style(
-            dpg.mvStyleVar_Alpha,
-            1,
-            category=dpg.mvThemeCat_Core,
-            parent=theme_component,
-        )
-        dpg.bind_item_theme(item, theme)
-        return alpha_style
-
-    all_components = dpg.get_item_children(theme, 1)
-    theme_component = None
-    for component in all_components:
-        if dpg.get_item_configuration(component)["item_type"] == dpg.mvAll:
-            theme_component = component
-            break
-    if theme_component is None:
-        theme_component = dpg.add_theme_component(parent=theme)
-
-    all_styles = dpg.get_item_children(theme_component, 1)
-    alpha_style = None
-    for style in all_styles:
-        if dpg.get_item_configuration(style)["target"] == dpg.mvStyleVar_Alpha:
-            alpha_style = style
-            break
-    if alpha_style is None:
-        alpha_style = dpg.add_theme_style(
-            dpg.mvStyleVar_Alpha,
-            1,
-            category=dpg.mvThemeCat_Core,
-            parent=theme_component,
+    frame_counter = state.frame_counter.copy()
+
+    if profiling:
+        lap = perf_counter()
+
+    ease = interpolate_eases(state, state.ease_index, frame_counter / state.duration)
+
+    if profiling:
+        lap = add_phase_time(EASE_PHASE, lap)
+
+    # group rows step their items below
+    grouped = due & state.is_group
+    due_items = due & ~state.is_group
+
+    steps = state.distance * np.where(due_items, ease - state.last_ease, 0.0)[:, None]
+
+    # keyframe tracks keep their linear progress as ease, the keys ease themselves
+    track_rows = np.flatnonzero(due_items & state.is_track)
+    if len(track_rows):
+        ease[track_rows] = np.clip(frame_counter[track_rows] / state.duration[track_rows], 0.0, 1.0)
+
+        for row in track_rows.tolist():
+            track = store.tracks[int(state.store_slot[row])]
+            steps[row] = track.step(float(state.last_ease[row]), float(ease[row]))
+
+    # retargeted animations carry their old speed in, until their loop restarts
+    blended_rows = np.flatnonzero(due_items & state.is_blended)
+    for row in blended_rows.tolist():
+        blend = store.blends.get(int(state.store_slot[row]))
+        if blend is None:
+            state.is_blended[row] = False
+        else:
+            steps[row] += blend_step(blend, float(frame_counter[row] / state.duration[row]), float(ease[row]))
+
+    # flag each row writes into its delta entries: 1 = running, 2 = cycle restarts,
+    # finishing rows only end an entry if no other row keeps it running
+    flags = np.zeros(count, dtype=np.int8)
+    flags[due & ((frame_counter < state.duration) | state.is_looping)] = 1
+    flags[due & state.is_cycle & (frame_counter == state.duration)] = 2
+    finishing = due & ~state.is_looping & (frame_counter == state.duration)
+
+    # one lane per item a row steps, a group row has one per group item, item -1 is a plain row
+    lane_rows = np.flatnonzero(due_items)
+    lane_items = np.full(len(lane_rows), -1, dtype=np.intp)
+    lane_slots = state.slot_index[lane_rows]
+    lane_steps = steps[lane_rows]
+
+    if grouped.any():
+        group_rows = np.flatnonzero(grouped)
+        ease[group_rows] = np.clip(frame_counter[group_rows] / state.duration[group_rows], 0.0, 1.0)
+        lanes = [(lane_rows, lane_items, lane_slots, lane_steps)]
+
+        for row in group_rows.tolist():
+            lanes.append(group_lanes(state, row, float(frame_counter[row])))
+
+        # the scalar engine steps the items of a group in between the other rows, in row order
+        lane_rows, lane_items, lane_slots, lane_steps = (np.concatenate(column) for column in zip(*lanes))
+        order = np.argsort(lane_rows, kind="stable")
+        lane_rows, lane_items, lane_slots, lane_steps = (
+            lane_rows[order], lane_items[order], lane_slots[order], lane_steps[order]
         )
-    return alpha_style
 
+    lane_flags = flags[lane_rows]
+    lane_finishing = finishing[lane_rows]
+
+    # items without a delta entry start running from the start value of their first lane
+    missing = np.flatnonzero(state.item_state[lane_slots] == NO_ENTRY)
+    if len(missing):
+        created = missing[np.unique(lane_slots[missing], return_index=True)[1]]
+        state.item_value[lane_slots[created]] = lane_starts(state, lane_rows[created], lane_items[created])
+        lane_flags[created] = 1
+        lane_finishing[created] = False
+
+    np.add.at(state.item_value, lane_slots, lane_steps)
+
+    # the last flagged lane of an item decides its state, like update_delta_state() in order
+    last_flag = np.full(len(state.item_state), -1, dtype=np.intp)
+    np.maximum.at(last_flag, lane_slots, np.where(lane_flags > 0, np.arange(len(lane_slots)), -1))
+    flagged = last_flag >= 0
+    state.item_state[flagged] = np.where(lane_flags[last_flag[flagged]] == 1, ENTRY_RUNNING, ENTRY_FINISHED)
+
+    finishing_items = np.zeros(len(state.item_state), dtype=bool)
+    finishing_items[lane_slots[lane_finishing]] = True
+    state.item_state[finishing_items & ~flagged & (state.item_state != ENTRY_RUNNING)] = ENTRY_FINISHED
+
+    if profiling:
+        add_phase_time(DELTA_PHASE, lap)
+
+    state.last_ease = np.where(due, ease, state.last_ease)
+
+    running = due & ((frame_counter < state.duration) | state.is_reversed)
+    counted = running & ~state.is_timed
+    bounce = counted & state.is_reversed & (frame_counter == 0)
+    state.frame_counter[counted & ~state.is_reversed] += 1
+    state.frame_counter[counted & state.is_reversed & (frame_counter != 0)] -= 1
+    state.frame_counter[bounce] = 1
+    state.is_reversed[bounce] = False
+
+    timed_bounce = running & state.is_timed & state.is_reversed & (frame_counter == 0)
+    state.is_reversed[timed_bounce] = False
+    state.starttime[timed_bounce] += state.duration[timed_bounce]
+
+    finished = due & ~running & (frame_counter == state.duration)
+    dropped = due & ~running & (frame_counter > state.duration)
+    restarting = timed_bounce.copy()
+    callbacks = []
+
+    for row in np.flatnonzero(early | finished | restarting).tolist():
+        animation = state.animations[row]
+
+        if early[row]:
+            callbacks.append(
+                (animation.early_callback, animation.object_name, animation.early_callback_data)
+            )
+
+        if finished[row]:
+            if animation.loop:
+                write_batch_row(state, row)
+                set_loop(animation)
+                read_batch_row(state, row)
+                restarting[row] = animation.loop != AnimationLoopType.PING_PONG
+            else:
+                dropped[row] = True
+
+            if animation.callback_function:
+                callbacks.append(
+                    (animation.callback_function, animation.object_name, animation.callback_data)
+                )
+
+        # the next iteration of a timed animation already started on the clock
+        if restarting[row] and animation.early_callback and state.is_timed[row]:
+            callbacks.append(
+                (animation.early_callback, animation.object_name, animation.early_callback_data)
+            )
 
-def set_opacity():
+    if dropped.any():
+        for row in np.flatnonzero(dropped).tolist():
+            unindex_animation(state.animations[row])
+            completed_animations += 1
+
+        compact_batch(state, dropped)
+
+    return callbacks
+
+
+def interpolate_eases(state: BatchState, ease_index, progress):
     """
-    set items opacity
+    same interpolation as cached_bezier_transition(), for many progress values at once,
+    ease_index picks the sampled table per value or one for all
     """
 
-    global delta_opacities
+    last_sample = state.ease_table.shape[1] - 1
+    position = np.clip(progress, 0.0, 1.0) * last_sample
+    index = np.minimum(position.astype(np.intp), last_sample - 1)
+    lower = state.ease_table[ease_index, index]
+    upper = state.ease_table[ease_index, index + 1]
 
-    items_updated = []
+    return lower + (upper - lower) * (position - index)
 
-    for item in delta_opacities:
-        if item[2] is None:
-            items_updated.append(item)
-            continue
 
-        elif item[2]:
-            item[2] = None
-            items_updated.append(item)
+def group_lanes(state: BatchState, row: int, frame_counter: float):
+    """
+    steps the items of a group row like add_group_deltas(),
+    returns the rows, items, delta slots and steps of its lanes
+    """
+
+    group = store.groups[int(state.store_slot[row])]
+    items = np.arange(len(group.tags))
 
-        if dpg.get_item_type(item[0]) == "mvAppItemType::mvText":
-            new_color = dpg.get_item_configuration(item[0])["color"]
-            new_color = list(map(lambda color: int(color * 255), new_color[:3:]))
+    ease = interpolate_eases(state, state.ease_index[row], (frame_counter - items * group.stagger) / group.duration)
+    last_eases = np.frombuffer(group.last_eases)
+    step = ease - last_eases
+    last_eases[:] = ease
 
-            new_color.append(item[1] * 255)
+    steps = np.column_stack((np.frombuffer(group.distance_x) * step, np.frombuffer(group.distance_y) * step))
 
-            dpg.configure_item(item[0], color=new_color)
-        else:
-            dpg.set_value(dpg_get_alpha_style(item[0]), [item[1]])
+    return np.full(len(items), row, dtype=np.intp), items, state.group_slots[int(state.store_slot[row])], steps
+
+
+def lane_starts(state: BatchState, rows, items):
+    """
+    returns the start values of lanes, from the store for plain rows and from the group for group items
+    """
+
+    store_slot = state.store_slot[rows]
+    starts = np.column_stack(
+        (np.frombuffer(store.start_x)[store_slot], np.frombuffer(store.start_y)[store_slot])
+    )
+
+    for lane in np.flatnonzero(items >= 0).tolist():
+        group = store.groups[int(store_slot[lane])]
+        item = int(items[lane])
+        starts[lane] = group.start_x[item], group.start_y[item]
+
+    return starts
+
+
+def compact_batch(state: BatchState, dropped):
+    """
+    removes the dropped rows from the batch arrays
+    """
+
+    for row in np.flatnonzero(dropped).tolist():
+        write_batch_row(state, row)
+        state.group_slots.pop(int(state.store_slot[row]), None)
+
+    keep = ~dropped
+    for name in BATCH_ARRAYS:
+        setattr(state, name, getattr(state, name)[keep])
 
-    delta_opacities = items_updated
+    state.animations = [a for a, k in zip(state.animations, keep.tolist()) if k]
+    state.rows = {id(animation): row for row, animation in enumerate(state.animations)}
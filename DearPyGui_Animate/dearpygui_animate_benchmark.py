@@ -0,0 +1,836 @@
+"""
+Headless benchmark for dearpygui_animate add-on
+
+https://github.com/mrtnRitter/DearPyGui_Animate
+
+runs add, run, get, remove and the set_* apply functions against a stub
+dearpygui backend that records every call, so no window is needed
+
+    python dearpygui_animate_benchmark.py
+    python dearpygui_animate_benchmark.py --batch --compare last_results.json
+    python dearpygui_animate_benchmark.py --threaded --render-ms 8
+    python dearpygui_animate_benchmark.py --check --batch --threaded
+
+"""
+
+import argparse
+import contextlib
+from dataclasses import asdict, dataclass
+import gc
+import importlib
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import types
+
+
+# -----------------------------------------------------------------------------
+# 				Stub Backend
+# -----------------------------------------------------------------------------
+
+
+class StubBackend(types.ModuleType):
+    """
+    stands in for dearpygui.dearpygui, keeps a minimal item registry
+    and counts the calls made by the add-on
+    """
+
+    mvAll = 0
+    mvStyleVar_Alpha = 1
+    mvThemeCat_Core = 0
+
+    def __init__(self):
+        super().__init__("dearpygui.dearpygui")
+        self.reset()
+
+    def reset(self):
+        self.clock = 0.0
+        self.delta_time = 1 / 60  # time of the last frame
+        self.calls: dict[str, int] = {}
+        self.items: dict = {}  # tag -> configuration
+        self.children: dict = {}  # tag -> child tags
+        self.themes: dict = {}  # item tag -> bound theme
+        self.next_tag = 1_000_000
+
+    def record(self, name: str):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def add_item(self, tag, item_type, **configuration):
+        self.items[tag] = {"item_type": item_type, **configuration}
+        return tag
+
+    def new_item(self, item_type, parent=None, **configuration):
+        self.next_tag += 1
+        self.add_item(self.next_tag, item_type, **configuration)
+        if parent is not None:
+            self.children.setdefault(parent, []).append(self.next_tag)
+        return self.next_tag
+
+    # dearpygui api used by the add-on
+
+    def get_total_time(self):
+        self.record("get_total_time")
+        return self.clock
+
+    def get_delta_time(self):
+        self.record("get_delta_time")
+        return self.delta_time
+
+    def get_item_type(self, item):
+        self.record("get_item_type")
+        return self.items[item]["item_type"]
+
+    def get_item_configuration(self, item):
+        self.record("get_item_configuration")
+        return self.items[item]
+
+    def configure_item(self, item, **configuration):
+        self.record("configure_item")
+        self.items[item].update(configuration)
+
+    def set_item_pos(self, item, pos):
+        self.record("set_item_pos")
+        self.items[item]["pos"] = pos
+
+    def set_value(self, item, value):
+        self.record("set_value")
+        self.items[item]["value"] = value
+
+    def get_value(self, item):
+        self.record("get_value")
+        return self.items[item].get("value")
+
+    def does_item_exist(self, item):
+        self.record("does_item_exist")
+        return item in self.items
+
+    def delete_item(self, item):
+        self.record("delete_item")
+        del self.items[item]
+        self.themes.pop(item, None)
+
+    def get_item_theme(self, item):
+        self.record("get_item_theme")
+        return self.themes.get(item)
+
+    def bind_item_theme(self, item, theme):
+        self.record("bind_item_theme")
+        self.themes[item] = theme or None
+
+    def get_item_children(self, item, slot=None):
+        self.record("get_item_children")
+        return self.children.get(item, [])
+
+    def add_theme(self):
+        self.record("add_theme")
+        return self.new_item("mvAppItemType::mvTheme")
+
+    def add_theme_component(self, item_type=0, parent=None, enabled_state=True):
+        self.record("add_theme_component")
+        return self.new_item(item_type, parent=parent, enabled_state=enabled_state)
+
+    def add_theme_color(self, target, value, category=0, parent=None):
+        self.record("add_theme_color")
+        return self.new_item("mvAppItemType::mvThemeColor", parent=parent, target=target, category=category, value=value)
+
+    def add_theme_style(self, target, x=1.0, y=-1.0, category=0, parent=None):
+        self.record("add_theme_style")
+        return self.new_item("mvAppItemType::mvThemeStyle", parent=parent, target=target, category=category, value=[x, y])
+
+    def is_item_visible(self, item):
+        self.record("is_item_visible")
+        return self.items[item].get("visible", True)
+
+    def mutex(self):
+        self.record("mutex")
+        return contextlib.nullcontext()
+
+
+backend = StubBackend()
+
+# the add-on imports dearpygui at module level, provide the stub when it is not installed
+try:
+    import dearpygui.dearpygui  # noqa: F401
+except ImportError:
+    sys.modules["dearpygui"] = types.ModuleType("dearpygui")
+    sys.modules["dearpygui"].dearpygui = backend
+    sys.modules["dearpygui.dearpygui"] = backend
+
+import dearpygui_animate as animate  # noqa: E402
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# -----------------------------------------------------------------------------
+# 				Scenarios
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class Scenario:
+    name: str
+    animations: int
+    items: int
+    types: tuple = ("position",)  # animation types, assigned round robin
+    loop: str = ""
+    eases: str = "single"  # either: single mixed unique
+    timing: str = "frames"
+    text_items: bool = False  # opacity on mvText goes through the color path
+    hidden: float = 0.0  # share of items that are not visible, culled with set_culling()
+
+
+SCENARIOS = [
+    # scaled by animation count
+    Scenario("position-100", 100, 100),
+    Scenario("position-1k", 1_000, 1_000),
+    Scenario("position-10k", 10_000, 10_000),
+    # scaled by item count, animations adding up on few items
+    Scenario("position-1k-on-10-items", 1_000, 10),
+    Scenario("position-1k-on-100-items", 1_000, 100),
+    # per animation type
+    Scenario("size-1k", 1_000, 1_000, types=("size",)),
+    Scenario("opacity-1k", 1_000, 1_000, types=("opacity",)),
+    Scenario("opacity-text-1k", 1_000, 1_000, types=("opacity",), text_items=True),
+    Scenario("mixed-types-3k", 3_000, 1_000, types=("position", "size", "opacity")),
+    Scenario("mixed-types-3k-half-hidden", 3_000, 1_000, types=("position", "size", "opacity"), hidden=0.5),
+    # per loop type
+    Scenario("loop-ping-pong-1k", 1_000, 1_000, loop="ping-pong"),
+    Scenario("loop-cycle-1k", 1_000, 1_000, loop="cycle"),
+    Scenario("loop-continue-1k", 1_000, 1_000, loop="continue"),
+    # per ease variety
+    Scenario("eases-mixed-1k", 1_000, 1_000, eases="mixed"),
+    # every curve distinct, as many as the default ease cache holds and twice that,
+    # the curves beyond the cache are solved directly instead of evicting tables in use
+    Scenario("eases-unique-64", 64, 64, eases="unique"),
+    Scenario("eases-unique-128", 128, 128, eases="unique"),
+    # seconds based timing
+    Scenario("seconds-1k", 1_000, 1_000, timing="seconds"),
+]
+
+# a few common curves, see https://cubic-bezier.com/
+EASES = [
+    [0, 0, 1, 1],
+    [0.25, 0.1, 0.25, 1],
+    [0.42, 0, 1, 1],
+    [0, 0, 0.58, 1],
+    [0.42, 0, 0.58, 1],
+    [0, 0.06, 0.2, 0.99],
+    [0.57, 0.06, 0.61, 0.86],
+    [0.68, -0.55, 0.27, 1.55],
+]
+
+
+def start_values(animation_type: str, rng: random.Random):
+    if animation_type == "opacity":
+        return rng.random(), rng.random()
+
+    if animation_type == "size":
+        return [rng.randint(32, 400), rng.randint(32, 400)], [rng.randint(32, 400), rng.randint(32, 400)]
+
+    return [rng.randint(0, 1200), rng.randint(0, 700)], [rng.randint(0, 1200), rng.randint(0, 700)]
+
+
+def ease_for(scenario: Scenario, index: int, rng: random.Random):
+    if scenario.eases == "single":
+        return EASES[1]
+
+    if scenario.eases == "mixed":
+        return EASES[index % len(EASES)]
+
+    return [rng.random(), rng.uniform(-0.5, 1.5), rng.random(), rng.uniform(-0.5, 1.5)]
+
+
+# -----------------------------------------------------------------------------
+# 				Measurement
+# -----------------------------------------------------------------------------
+
+
+def percentiles(samples: list[float]):
+    """
+    nearest rank percentiles of a list of samples
+    """
+
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+
+    def rank(p):
+        return ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))]
+
+    return {
+        "p50": rank(50),
+        "p90": rank(90),
+        "p99": rank(99),
+        "max": ordered[-1],
+        "mean": sum(ordered) / len(ordered),
+    }
+
+
+class PhaseTimer:
+    """
+    wraps a module function and collects its call durations in microseconds
+    """
+
+    def __init__(self, module, name: str):
+        self.module = module
+        self.name = name
+        self.original = getattr(module, name)
+        self.samples: list[float] = []
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter_ns()
+            result = self.original(*args, **kwargs)
+            self.samples.append((time.perf_counter_ns() - start) / 1000)
+            return result
+
+        setattr(module, name, timed)
+
+    def restore(self):
+        setattr(self.module, self.name, self.original)
+
+
+def fresh_engine(engine: str):
+    """
+    reloads the add-on so every scenario starts with empty registers and caches,
+    engine is either: scalar batch threaded
+    """
+
+    animate.set_threaded(False)
+
+    # release the animations of the last scenario while their store still exists
+    for name in list(animate.animations_by_name):
+        animate.remove(name)
+    animate.batch_state = None
+    gc.collect()
+
+    backend.reset()
+    importlib.reload(animate)
+    animate.dpg = backend  # never touch a real dearpygui context
+
+    if engine == "batch":
+        animate.set_batch_mode(True)
+
+    elif engine == "threaded":
+        animate.set_threaded(True)
+
+
+def create_items(scenario: Scenario):
+    hidden = int(scenario.items * scenario.hidden)
+
+    for item in range(scenario.items):
+        if scenario.text_items:
+            backend.add_item(f"item{item}", "mvAppItemType::mvText", color=[1.0, 1.0, 1.0, 1.0])
+        else:
+            backend.add_item(f"item{item}", "mvAppItemType::mvButton")
+
+        if item < hidden:
+            backend.items[f"item{item}"]["visible"] = False
+
+    if hidden:
+        animate.set_culling(types=tuple(animate.AnimationType))
+
+
+def animation_specs(scenario: Scenario, seed: int):
+    """
+    returns the add() arguments of every animation of a scenario
+    """
+
+    rng = random.Random(seed)
+
+    specs = []
+    for index in range(scenario.animations):
+        animation_type = scenario.types[index % len(scenario.types)]
+        start, end = start_values(animation_type, rng)
+
+        if scenario.timing == "seconds":
+            duration = rng.uniform(0.5, 2.0)
+        else:
+            duration = rng.randint(30, 120)
+
+        specs.append(
+            {
+                "animation_type": animation_type,
+                "tag": f"item{index % scenario.items}",
+                "start_val": start,
+                "end_val": end,
+                "ease": ease_for(scenario, index, rng),
+                "duration": duration,
+                "name": f"animation{index}",
+                "loop": scenario.loop,
+                "timing": scenario.timing,
+            }
+        )
+
+    return specs
+
+
+def populate(scenario: Scenario, seed: int, bulk: bool = False):
+    """
+    creates the scenario items and adds its animations one by one or with add_many(),
+    returns the time spent adding in microseconds
+    """
+
+    create_items(scenario)
+    specs = animation_specs(scenario, seed)
+
+    start = time.perf_counter_ns()
+    if bulk:
+        animate.add_many(specs)
+    else:
+        for spec in specs:
+            animate.add(**spec)
+
+    return (time.perf_counter_ns() - start) / 1000
+
+
+def run_frames(frames: int, frame_time: float, render_time: float = 0.0):
+    """
+    runs frames and returns the time spent in run() per frame in microseconds,
+    render_time stands in for dpg rendering the frame, when the threaded engine works ahead
+    """
+
+    samples = []
+    for _ in range(frames):
+        backend.clock += frame_time
+        start = time.perf_counter_ns()
+        animate.run()
+        samples.append((time.perf_counter_ns() - start) / 1000)
+
+        if render_time:
+            time.sleep(render_time)
+
+    return samples
+
+
+def measure(scenario: Scenario, frames: int, engine: str, seed: int, render_time: float = 0.0):
+    """
+    runs one scenario and returns its timings in microseconds,
+    allocations in KiB and the stub backend call counts
+    """
+
+    frame_time = 1 / 60
+
+    # timings
+    fresh_engine(engine)
+    add_many_time = populate(scenario, seed, bulk=True)
+
+    fresh_engine(engine)
+    add_time = populate(scenario, seed)
+    names = list(animate.animations_by_name)
+
+    timers = [PhaseTimer(animate, name) for name in ("set_pos", "set_size", "set_opacity")]
+    frame_samples = run_frames(frames, frame_time, render_time)
+    for timer in timers:
+        timer.restore()
+
+    calls = dict(backend.calls)
+
+    get_samples = []
+    for _ in range(10):
+        start = time.perf_counter_ns()
+        animate.get("name", "framecounter", "ispaused")
+        get_samples.append((time.perf_counter_ns() - start) / 1000)
+
+    start = time.perf_counter_ns()
+    for name in names:
+        animate.remove(name)
+    remove_time = (time.perf_counter_ns() - start) / 1000
+
+    # allocations, measured in a separate pass since tracing slows everything down
+    fresh_engine(engine)
+    populate(scenario, seed)
+    animate.run()  # first frame builds caches and the batch arrays
+
+    tracemalloc.start()
+    frame_peaks = []
+    baseline = tracemalloc.get_traced_memory()[0]
+    for _ in range(min(frames, 30)):
+        backend.clock += frame_time
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        animate.run()
+        if engine == "threaded":
+            animate.frame_ready.wait()  # count the frame the worker computes meanwhile
+        frame_peaks.append((tracemalloc.get_traced_memory()[1] - before) / 1024)
+    growth = (tracemalloc.get_traced_memory()[0] - baseline) / 1024
+    tracemalloc.stop()
+
+    return {
+        "scenario": asdict(scenario),
+        "engine": engine,
+        "frames": frames,
+        "add_total_us": add_time,
+        "add_many_total_us": add_many_time,
+        "remove_total_us": remove_time,
+        "run_us": percentiles(frame_samples),
+        "apply_us": {timer.name: percentiles(timer.samples) for timer in timers},
+        "get_us": percentiles(get_samples),
+        "alloc_peak_kib_per_frame": percentiles(frame_peaks),
+        "alloc_growth_kib": growth,
+        "dpg_calls": calls,
+    }
+
+
+def legacy_bezier_transition(search: float, handles: list[float, float, float, float]):
+    """
+    the newton solver bezier_transition used before BezierSolver,
+    returns y and the iterations it took
+    """
+
+    h1x, h1y, h2x, h2y = handles
+
+    cx = 3 * h1x
+    bx = 3 * (h2x - h1x) - cx
+    ax = 1 - cx - bx
+
+    t = search
+
+    for i in range(100):
+        x = (ax * t**3 + bx * t**2 + cx * t) - search
+
+        if round(x, 4) == 0:
+            break
+
+        dx = 3.0 * ax * t**2 + 2.0 * bx * t + cx
+
+        t -= x / dx
+
+    return 3 * t * (1 - t) ** 2 * h1y + 3 * t**2 * (1 - t) * h2y + t**3, i
+
+
+def measure_solver(samples: int = 1025):
+    """
+    compares accuracy, iterations and speed of the legacy newton solver and
+    BezierSolver on every benchmark curve, against a tight reference solution
+    """
+
+    searches = [i / (samples - 1) for i in range(samples)]
+    results = []
+
+    for handles in EASES + [[1, 0, 0, 1], [0.99, 0, 0.99, 1]]:
+        reference = animate.BezierSolver(handles, epsilon=1e-13, max_newton=0)
+        expected = [reference.evaluate(search) for search in searches]
+        solver = animate.BezierSolver(handles, animate.ease_epsilon)
+
+        start = time.perf_counter_ns()
+        legacy = [legacy_bezier_transition(search, handles) for search in searches]
+        legacy_time = (time.perf_counter_ns() - start) / 1000 / samples
+
+        start = time.perf_counter_ns()
+        solved = [solver.solve(search) for search in searches]
+        solver_time = (time.perf_counter_ns() - start) / 1000 / samples
+
+        start = time.perf_counter_ns()
+        many = solver.evaluate_many(searches)
+        many_time = (time.perf_counter_ns() - start) / 1000 / samples
+
+        legacy_iterations = [iterations for _, iterations in legacy]
+        solver_iterations = [iterations for _, iterations in solved]
+
+        results.append(
+            {
+                "handles": handles,
+                "legacy": {
+                    "max_error": max(abs(y - e) for (y, _), e in zip(legacy, expected)),
+                    "mean_iterations": sum(legacy_iterations) / samples,
+                    "max_iterations": max(legacy_iterations),
+                    "us_per_sample": legacy_time,
+                },
+                "solver": {
+                    "max_error": max(abs(solver.sample_y(t) - e) for (t, _), e in zip(solved, expected)),
+                    "mean_iterations": sum(solver_iterations) / samples,
+                    "max_iterations": max(solver_iterations),
+                    "us_per_sample": solver_time,
+                },
+                "evaluate_many": {
+                    "max_error": max(abs(y - e) for y, e in zip(many, expected)),
+                    "us_per_sample": many_time,
+                },
+            }
+        )
+
+    return results
+
+
+def print_solver_results(results: list[dict]):
+    print(f"\n{'ease':<28}{'solver':<15}{'max error':>12}{'mean it':>9}{'max it':>8}{'us/sample':>11}")
+    for result in results:
+        for name in ("legacy", "solver", "evaluate_many"):
+            numbers = result[name]
+            print(
+                f"{str(result['handles']):<28}{name:<15}{numbers['max_error']:>12.2e}"
+                f"{numbers.get('mean_iterations', 0):>9.1f}{numbers.get('max_iterations', 0):>8}"
+                f"{numbers['us_per_sample']:>11.2f}"
+            )
+
+
+# -----------------------------------------------------------------------------
+# 				Checks
+# -----------------------------------------------------------------------------
+
+
+def check_retarget_convergence(engine: str, frames: int = 300):
+    """
+    retargets an animation to the same end on every frame, like an item following the pointer,
+    returns a failure per ease and timing whose item overshot the end or did not settle on it
+    """
+
+    failures = []
+
+    for timing in ("frames", "seconds"):
+        for ease in EASES[:-1]:  # the last curve starts backwards, every restart moves it away again
+            fresh_engine(engine)
+            backend.add_item("follower", "mvAppItemType::mvButton")
+            duration = 20 if timing == "frames" else 1 / 3
+            animate.add("position", "follower", [0, 0], [100, 0], ease, duration, name="follower", timing=timing)
+
+            positions = []
+            for _ in range(frames):
+                animate.retarget("follower", [100, 0])
+                backend.clock += 1 / 60
+                animate.run()
+                positions.append(backend.items["follower"].get("pos", [0, 0])[0])
+
+            # running values are truncated, a settled item stays up to one pixel short of the end
+            settled = positions[frames // 2 :]
+            if max(positions) > 100 or min(settled) < 99:
+                failures.append(
+                    f"retarget/{engine}/{timing} {ease}: went up to {max(positions)}, "
+                    f"settled between {min(settled)} and {max(settled)}"
+                )
+
+    return failures
+
+
+def mixed_item_frames(engine: str, seed: int, frames: int):
+    """
+    runs a random mix of animations, groups and tracks sharing a few items, with pauses and removals,
+    returns the position, size and overlay opacity of every item after each frame
+    """
+
+    fresh_engine(engine)
+    rng = random.Random(seed)
+    tags = [f"item{item}" for item in range(8)]
+    for tag in tags:
+        backend.add_item(tag, "mvAppItemType::mvButton")
+
+    def values(animation_type):
+        if animation_type == "opacity":
+            return rng.random()
+        if animation_type == "size":
+            return [rng.randint(32, 200), rng.randint(32, 200)]
+        return [rng.randint(0, 300), rng.randint(0, 300)]
+
+    for index in range(24):
+        animation_type = rng.choice(("position", "size", "opacity"))
+        options = {
+            "name": f"animation{index % 6}",
+            "loop": rng.choice(("", "ping-pong", "cycle", "continue")),
+            "timeoffset": rng.choice((0, 0, 0.1, 0.3)),
+        }
+        duration = rng.randint(5, 40)
+        if rng.random() < 0.2:
+            options["timing"] = "seconds"
+            duration /= 60
+
+        kind = rng.random()
+        if kind < 0.35:
+            group_tags = rng.sample(tags, rng.randint(2, 4))
+            ends = [values(animation_type) for _ in group_tags]
+            stagger = rng.randint(0, 4) if "timing" not in options else rng.randint(0, 4) / 60
+            animate.add_group(
+                animation_type, group_tags, values(animation_type), ends, rng.choice(EASES), duration, stagger, **options
+            )
+        elif kind < 0.45:
+            keys = [(0, values(animation_type)), (duration / 2, values(animation_type), rng.choice(EASES))]
+            animate.add_track(animation_type, rng.choice(tags), keys + [(duration, values(animation_type))], **options)
+        else:
+            start, end = values(animation_type), values(animation_type)
+            animate.add(animation_type, rng.choice(tags), start, end, rng.choice(EASES), duration, **options)
+
+    snapshots = []
+    for frame in range(frames):
+        if frame == 20:
+            animate.pause("animation1")
+        elif frame == 35:
+            animate.play("animation1")
+        elif frame == 50:
+            animate.remove("animation2")
+
+        backend.clock += 1 / 60
+        animate.run()
+
+        snapshot = {}
+        for tag in tags:
+            item = backend.items[tag]
+            overlay = animate.overlay_themes.get(tag)
+            snapshot[tag] = (item.get("pos"), item.get("width"), item.get("height"), overlay and overlay.opacity)
+        snapshots.append(snapshot)
+
+    return snapshots
+
+
+def check_batch_equivalence(seeds: int = 20, frames: int = 120):
+    """
+    runs the same random mix on the scalar and the batch engine,
+    returns a failure per seed whose items got different values on both
+    """
+
+    failures = []
+
+    for seed in range(seeds):
+        scalar = mixed_item_frames("scalar", seed, frames)
+        batch = mixed_item_frames("batch", seed, frames)
+
+        for frame, (expected, actual) in enumerate(zip(scalar, batch)):
+            # both engines sum the steps in another order, running values may truncate one pixel apart
+            mismatches = [tag for tag in expected if not values_match(expected[tag], actual[tag])]
+            if mismatches:
+                tag = mismatches[0]
+                failures.append(f"equivalence/seed {seed} frame {frame} {tag}: scalar {expected[tag]} batch {actual[tag]}")
+                break
+
+    return failures
+
+
+def values_match(expected: tuple, actual: tuple):
+    position, width, height, opacity = expected
+    other_position, other_width, other_height, other_opacity = actual
+
+    if (position is None) != (other_position is None) or (opacity is None) != (other_opacity is None):
+        return False
+
+    return (
+        (position is None or all(abs(a - b) <= 1 for a, b in zip(position, other_position)))
+        and abs((width or 0) - (other_width or 0)) <= 1
+        and abs((height or 0) - (other_height or 0)) <= 1
+        and (opacity is None or abs(opacity - other_opacity) <= 1e-6)
+    )
+
+
+# -----------------------------------------------------------------------------
+# 				Reporting
+# -----------------------------------------------------------------------------
+
+
+def result_key(result: dict):
+    return f"{result['scenario']['name']}/{result['engine']}"
+
+
+TABLE_HEADER = f"{'scenario':<32}{'engine':<8}{'p50 us':>10}{'p90 us':>10}{'p99 us':>10}{'alloc KiB':>11}{'writes':>9}"
+
+
+def print_result(result: dict):
+    run_us = result["run_us"]
+    calls = result["dpg_calls"]
+    writes = sum(calls.get(name, 0) for name in ("set_item_pos", "configure_item", "set_value"))
+    print(
+        f"{result['scenario']['name']:<32}{result['engine']:<8}"
+        f"{run_us['p50']:>10.0f}{run_us['p90']:>10.0f}{run_us['p99']:>10.0f}"
+        f"{result['alloc_peak_kib_per_frame']['p50']:>11.1f}{writes:>9}",
+        flush=True,
+    )
+
+
+def compare_results(results: list[dict], previous_path: str, threshold: float):
+    """
+    compares the run() p50 against a saved result file, returns the regressions
+    """
+
+    with open(previous_path) as file:
+        previous = {result_key(result): result for result in json.load(file)["results"]}
+
+    regressions = []
+    for result in results:
+        old = previous.get(result_key(result))
+        if old is None:
+            continue
+
+        old_p50 = old["run_us"]["p50"]
+        new_p50 = result["run_us"]["p50"]
+        if old_p50 and new_p50 > old_p50 * (1 + threshold):
+            regressions.append(f"{result_key(result)}: run p50 {old_p50:.0f} us -> {new_p50:.0f} us")
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=60, help="frames per scenario")
+    parser.add_argument("--filter", default="", help="only run scenarios whose name contains this")
+    parser.add_argument("--batch", action="store_true", help="also run every scenario with the batch engine")
+    parser.add_argument("--threaded", action="store_true", help="also run every scenario with the background worker")
+    parser.add_argument("--render-ms", type=float, default=0.0, help="simulated dpg render time after each run()")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="dearpygui_animate_benchmark.json", help="where to save the results")
+    parser.add_argument("--compare", help="result file of an earlier run to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed p50 slowdown, 0.10 = 10%%")
+    parser.add_argument("--check", action="store_true", help="run the engine checks instead of the benchmark")
+    args = parser.parse_args(argv)
+
+    engines = ["scalar"]
+    if args.batch:
+        if numpy is None:
+            parser.error("--batch requires numpy")
+        engines.append("batch")
+    if args.threaded:
+        engines.append("threaded")
+
+    if args.check:
+        failures = []
+        for engine in engines:
+            failures += check_retarget_convergence(engine)
+        if "batch" in engines:
+            failures += check_batch_equivalence()
+
+        for failure in failures:
+            print(f"FAILED {failure}")
+        print(f"{len(failures)} checks failed" if failures else "all checks passed")
+
+        return 1 if failures else 0
+
+    print(TABLE_HEADER)
+    print("-" * len(TABLE_HEADER))
+
+    results = []
+    for scenario in SCENARIOS:
+        if args.filter not in scenario.name:
+            continue
+        for engine in engines:
+            results.append(measure(scenario, args.frames, engine, args.seed, args.render_ms / 1000))
+            print_result(results[-1])
+
+    solver_results = measure_solver()
+    print_solver_results(solver_results)
+
+    with open(args.output, "w") as file:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "numpy": getattr(numpy, "__version__", None),
+                "results": results,
+                "solver": solver_results,
+            },
+            file,
+            indent=2,
+        )
+    print(f"\nresults saved to {args.output}")
+
+    if args.compare:
+        regressions = compare_results(results, args.compare, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
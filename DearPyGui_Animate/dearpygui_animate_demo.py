@@ -24,19 +24,8 @@ def onUpdate():
 
 
 def update_running_animations():
-    playing = animate.get("isplaying")
-
-    if playing:
-        running = 0
-
-        for play in playing:
-            if play:
-                running += 1
-
-        dpg.set_value("running_animations", "animations running: " + str(running))
-
-    else:
-        dpg.set_value("running_animations", "animations running: 0")
+    running = animate.get_stats()["active"]
+    dpg.set_value("running_animations", "animations running: " + str(running))
 
 
 # -----------------------------------------------------------------------------